@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""
+Benchmarks for pynetdot internals. They use synthetic data and do not need a
+netdot server.
+
+Usage:
+    python benchmark.py memory [rows]
+    python benchmark.py import [runs] [max_ms]
+    python benchmark.py save [objects]
+    python benchmark.py parse [rows]
+    python benchmark.py links [rows] [targets]
+"""
+
+from __future__ import print_function
+import gc
+import os
+import subprocess
+import sys
+import time
+
+import pynetdot
+import pynetdot.fields as f
+from pynetdot import netdot
+from pynetdot.cache import CachedResponse
+
+
+def rss():
+    """Resident memory of this process in bytes (linux only)."""
+    with open('/proc/self/statm') as fh:
+        return int(fh.read().split()[1]) * 4096
+
+
+def physaddr_row(i):
+    """Attributes of a PhysAddr object, as parsed from netdot's XML."""
+    return {
+        'id': str(i),
+        'address': '%012X' % (0x001122000000 + i),
+        'first_seen': '2016-09-28 09:36:%02d' % (i % 60),
+        'last_seen': '2017-03-01 12:00:%02d' % (i % 60),
+        'static': '0',
+    }
+
+
+def bench_memory(rows=1000000):
+    """Memory held by rows PhysAddr objects loaded from netdot."""
+    cls = pynetdot.PhysAddr
+    gc.collect()
+    before = rss()
+    start = time.time()
+    objects = []
+    for i in range(1, rows + 1):
+        obj = cls(id=i)
+        cls._from_netdot(obj, physaddr_row(i))
+        objects.append(obj)
+    elapsed = time.time() - start
+    gc.collect()
+    used = rss() - before
+    print('memory: %d PhysAddr objects use %.1f MB (%d bytes/object), %.1fs' % (
+        rows, used / 1e6, used / rows, elapsed))
+
+
+def bench_import(runs=20, max_ms=None):
+    """
+    Time of 'import pynetdot' in a fresh interpreter, minus the time of
+    starting the interpreter. Exits with an error if the median is above max_ms.
+    """
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+
+    def median_ms(code):
+        times = []
+        for _ in range(runs):
+            start = time.time()
+            subprocess.check_call([sys.executable, '-c', code], env=env)
+            times.append(time.time() - start)
+        return sorted(times)[len(times) // 2] * 1000
+
+    base = median_ms('pass')
+    result = median_ms('import pynetdot') - base
+    print('import: median %.1f ms over %d runs' % (result, runs))
+    if max_ms is not None and result > max_ms:
+        print('import: slower than %d ms' % max_ms)
+        sys.exit(1)
+
+
+def object_xml(cls, i):
+    """XML of an object with all fields set, as netdot sends it."""
+    attrs = ['id="%d"' % i]
+    for field in cls._fields:
+        if isinstance(field, f.LinkField):
+            attrs.append('%s="label %d" %s_xlink="%s/%d"' % (field.name, i, field.name, field.link_to, i))
+        elif isinstance(field, f.DateTimeField):
+            attrs.append('%s="2017-03-01 12:00:%02d"' % (field.name, i % 60))
+        elif isinstance(field, f.DateField):
+            attrs.append('%s="2017-03-01"' % field.name)
+        elif isinstance(field, (f.BoolField, f.IntegerField)):
+            attrs.append('%s="%d"' % (field.name, i % 2))
+        else:
+            attrs.append('%s="%s %d"' % (field.name, field.name, i))
+    return '<opt %s />' % ' '.join(attrs)
+
+
+class FakeAPI(object):
+    """Answers every POST with the same object, without a network."""
+    identity_map = None
+    pool_size = 1
+
+    def __init__(self, content):
+        self.content = content.encode('utf-8')
+
+    def post(self, resource, params):
+        return CachedResponse(resource, self.content)
+
+
+def bench_save(objects=20000):
+    """Interface updates per second with and without reloading the response."""
+    cls = pynetdot.Interface
+    netdot.api = FakeAPI(object_xml(cls, 1))
+    interfaces = []
+    for i in range(1, objects + 1):
+        obj = cls(id=i)
+        cls._from_netdot(obj, dict(netdot.parse_attrs(object_xml(cls, i))))
+        interfaces.append(obj)
+    for reload in (True, ['monitored'], False):
+        start = time.time()
+        for obj in interfaces:
+            obj.monitored = not obj.monitored
+            obj.save(reload=reload)
+        elapsed = time.time() - start
+        print('save: reload=%s %d saves/s' % (reload, objects / elapsed))
+
+
+def bench_parse(rows=20000):
+    """
+    Interface and Device rows parsed per second, calling parse of each field
+    and with the compiled parser of the model.
+    """
+    def parse_fields(cls, obj, attrs):
+        obj._attrs = attrs
+        obj._values = [None] * len(cls._fields)
+        for field in cls._fields:
+            field.parse(obj)
+        obj._attrs = None
+
+    def parse_compiled(cls, obj, attrs):
+        cls._from_netdot(obj, attrs)
+
+    for cls in (pynetdot.Interface, pynetdot.Device):
+        data = [dict(netdot.parse_attrs(object_xml(cls, i))) for i in range(1, rows + 1)]
+        for name, parse in (('fields', parse_fields), ('compiled', parse_compiled)):
+            objects = [cls(id=i) for i in range(1, rows + 1)]
+            start = time.time()
+            for obj, attrs in zip(objects, data):
+                parse(cls, obj, attrs)
+            elapsed = time.time() - start
+            print('parse: %s %s %d rows/s' % (cls.__name__, name, rows / elapsed))
+
+
+def bench_links(rows=300000, targets=1000):
+    """
+    Memory held by rows FWTableEntry objects of one search response, linking
+    to targets distinct Interface and PhysAddr objects, with linked objects
+    created for each row and shared by the rows of the response.
+    """
+    cls = pynetdot.FWTableEntry
+    netdot.api = FakeAPI('')
+    content = '<opt>%s</opt>' % ''.join(
+        '<FWTableEntry id="%d" fwtable_xlink="FWTable/1" interface_xlink="Interface/%d" '
+        'physaddr_xlink="PhysAddr/%d" />' % (i, i % targets, i % targets) for i in range(1, rows + 1))
+    response = CachedResponse('FWTableEntry', content.encode('utf-8'))
+    for name in ('shared', 'per row'):
+        gc.collect()
+        before = rss()
+        start = time.time()
+        if name == 'shared':
+            objects = cls._from_search_response(response)
+        else:
+            objects = [cls._from_search_result(attrs) for attrs in netdot.parse_rows(response.content)]
+        elapsed = time.time() - start
+        gc.collect()
+        used = rss() - before
+        print('links: %s %d objects use %.1f MB (%d bytes/object), %.1fs' % (
+            name, rows, used / 1e6, used / rows, elapsed))
+        del objects
+
+
+BENCHMARKS = {
+    'memory': bench_memory,
+    'import': bench_import,
+    'save': bench_save,
+    'parse': bench_parse,
+    'links': bench_links,
+}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print(__doc__)
+        sys.exit(1)
+    BENCHMARKS[sys.argv[1]](*[int(a) for a in sys.argv[2:]])
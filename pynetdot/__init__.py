@@ -1,8 +1,36 @@
 from __future__ import absolute_import
-from .netdot import setup, load_settings
-from .models import *
+import sys
+from importlib import import_module
+from .netdot import setup, setup_async, load_settings, get_api, batch, BulkError, DoesNotExist
+from .cache import ResponseCache
+from .sync import Sync, MemoryStore
 
 __version__ = '1.5.1'
 
-settings = load_settings()
-setup(url=settings['url'], username=settings['username'], password=settings['password'], kerberos=settings['kerberos'])
+# Settings are loaded, the API is set up and model classes are created only
+# when they are first used, so importing pynetdot is cheap.
+
+def __getattr__(name):
+    if name == 'settings':
+        globals()['settings'] = load_settings()
+        return globals()['settings']
+    if name.startswith('__') and name != '__all__':
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    models = import_module('.models', __name__)
+    if name == 'models':
+        return models
+    if name == '__all__':
+        return ['setup', 'setup_async', 'load_settings', 'get_api', 'batch', 'BulkError', 'DoesNotExist', 'ResponseCache', 'Sync', 'MemoryStore'] + models.__all__
+    try:
+        return getattr(models, name)
+    except AttributeError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+def __dir__():
+    models = import_module('.models', __name__)
+    return sorted(set(globals()) | set(models.__all__))
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ (PEP 562), import everything now
+    from .models import *
+    settings = load_settings()
@@ -0,0 +1,185 @@
+"""
+asyncio support. Requires python 3.5+ and the httpx module.
+"""
+import logging
+import pynetdot
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNetdotAPI(object):
+    """
+    Like NetdotAPI, but all calls are coroutines. Requests are made with a
+    httpx.AsyncClient that pools its connections to netdot.
+    """
+    def __init__(self, url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False, pool_size=10, keep_alive=True):
+        import httpx
+        from .api import NetdotAPI
+        if not url.endswith('/'):
+            url = '%s/' % url
+        self.url = url
+        self.username = username
+        self.password = password
+        self.verify = verify
+        if kerberos:
+            from httpx_gssapi import HTTPSPNEGOAuth, REQUIRED
+            self.auth = HTTPSPNEGOAuth(mutual_authentication=REQUIRED, opportunistic_auth=True)
+        else:
+            self.auth = None
+        self.kerberos = kerberos
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        headers = dict(NetdotAPI.HEADERS)
+        headers['User-Agent'] = headers['User-Agent'].format(version=pynetdot.__version__)
+        if not keep_alive:
+            headers['Connection'] = 'close'
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size if keep_alive else 0)
+        self.client = httpx.AsyncClient(headers=headers, verify=verify, auth=self.auth, limits=limits)
+        self._login_generation = 0
+        self._login_lock = None
+
+    async def _request(self, method, resource, **kwargs):
+        url = self.url + 'rest/' + resource
+        generation = await self._ensure_login()
+        response = await self.client.request(method, url, **kwargs)
+        if response.status_code == 403:
+            await self._ensure_login(expired=generation)
+            response = await self.client.request(method, url, **kwargs)
+        return response
+
+    async def get(self, resource, **kwargs):
+        return await self._request('GET', resource, **kwargs)
+
+    async def post(self, resource, params, **kwargs):
+        return await self._request('POST', resource, params=params, **kwargs)
+
+    async def delete(self, resource, **kwargs):
+        return await self._request('DELETE', resource, **kwargs)
+
+    async def close(self):
+        """Close all pooled connections to netdot."""
+        await self.client.aclose()
+
+    async def _ensure_login(self, expired=None):
+        """
+        Log in if not logged in yet, or if login generation expired is still
+        the current one, see NetdotAPI._ensure_login. Returns the generation
+        of the login in use.
+        """
+        generation = self._login_generation
+        if generation and generation != expired:
+            return generation
+        if self._login_lock is None:
+            import asyncio
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            # skip if another task logged in while this one was waiting
+            if self._login_generation == generation:
+                await self._login()
+                self._login_generation += 1
+            return self._login_generation
+
+    async def _login(self):
+        # cookies of the expired login are replaced by the response, not
+        # cleared, other tasks may be sending requests with them
+        if self.auth is None:
+            login_url = self.url + 'NetdotLogin'
+            params = {
+                'destination':'index.html',
+                'credential_0':self.username,
+                'credential_1':self.password,
+                'permanent_session':1,
+            }
+            # a good login answers with a redirect to destination
+            response = await self.client.post(login_url, data=params)
+            if not response.is_error:
+                logger.info('Logged into netdot with username %s' % self.username)
+            else:
+                raise AttributeError('Invalid Credentials: %s' % response)
+        else:
+            response = await self.client.get(self.url)
+            if not response.is_error:
+                logger.info('Logged into netdot with auth: %s' % self.auth)
+            else:
+                raise AttributeError('Authentication error: %s' % response)
+
+
+def _get_api():
+    from .netdot import async_api
+    if async_api is None:
+        raise Exception('Async API not set up, call pynetdot.setup_async first')
+    return async_api
+
+
+class AsyncNetdotMixin(object):
+    """
+    Awaitable counterparts of Netdot model methods. They use the API created
+    by pynetdot.setup_async.
+
+    Linked objects are not resolved automatically in a non-blocking way,
+    await their aresolve method before reading their attributes.
+    """
+    __slots__ = ()
+
+    @classmethod
+    async def aall(cls, only=None):
+        return await cls._asearch(only=only)
+
+    @classmethod
+    async def asearch(cls, only=None, **kwargs):
+        if not kwargs:
+            raise Exception('Need to specify search parameters')
+        return await cls._asearch(only=only, **kwargs)
+
+    @classmethod
+    async def _asearch(cls, only=None, **kwargs):
+        params = cls._build_search_params(**kwargs)
+        response = await _get_api().get(cls.resource, params=params)
+        return cls._from_search_response(response, only)
+
+    @classmethod
+    async def aget_first(cls, **kwargs):
+        results = await cls.asearch(**kwargs)
+        if not results:
+            return None
+        return results[0]
+
+    @classmethod
+    async def aget(cls, id):
+        obj = cls._instance(int(id))
+        if not obj._resolved:
+            await obj.aresolve()
+        return obj
+
+    async def aresolve(self):
+        """Fetch attributes of an unresolved object (i.e. one from a link)."""
+        logger.debug('Resolving %s ID:%d' % (self.__class__, self.id))
+        response = await _get_api().get(self._resolve_resource())
+        self._from_resolve_response(response)
+        return self
+
+    async def asave(self, reload=True):
+        request = self._save_request()
+        if request is None:
+            return True
+        resource, params = request
+        response = await _get_api().post(resource, params)
+        return self._from_save_response(response, reload)
+
+    async def adelete(self):
+        if not self.id:
+            return True
+        resource = '%s%s' % (self.resource, self.id)
+        response = await _get_api().delete(resource)
+        return self._from_delete_response(response)
+
+    async def arelated(self, name):
+        """
+        Awaitable counterpart of reverse link attributes, i.e.
+        await device.arelated('interfaces') instead of device.interfaces.
+        """
+        from .fields import ReverseLink
+        link = getattr(type(self), name, None)
+        if not isinstance(link, ReverseLink):
+            raise AttributeError('%s has no reverse link %s' % (self.__class__.__name__, name))
+        return await link.link_class.asearch(**{link.field: self.id})
@@ -1,6 +1,10 @@
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import pynetdot
+from .identitymap import IdentityMap
+from .cache import CachedResponse, ResponseCache, Validators
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +15,7 @@ class NetdotAPI(object):
         'Accept':'text/xml; version=1.0',
     }
 
-    def __init__(self, url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False):
+    def __init__(self, url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False, pool_size=10, keep_alive=True, identity_map=False, identity_map_size=100000, cache=None, conditional_requests=1000):
         if not url.endswith('/'):
             url = '%s/' % url
         self.url = url
@@ -24,46 +28,139 @@ class NetdotAPI(object):
         else:
             self.auth = None
         self.kerberos = kerberos
-        self._cookies = None
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        if identity_map:
+            self.identity_map = IdentityMap(max_size=identity_map_size)
+        else:
+            self.identity_map = None
+        # optional ResponseCache
+        self.cache = cache
+        # validators of the last conditional_requests URLs, to send If-None-Match
+        # and If-Modified-Since with GETs
+        if conditional_requests:
+            self.validators = Validators(max_entries=conditional_requests)
+        else:
+            self.validators = None
+        # incremented by every login, 0 until the first one
+        self._login_generation = 0
+        self._login_lock = threading.Lock()
         self._set_headers()
+        self.session = self._build_session()
 
     def _set_headers(self):
         self._headers = self.HEADERS
         self._headers['User-Agent'] = self._headers['User-Agent'].format(version=pynetdot.__version__)
 
-    def get(self, resource, **kwargs):
+    def _build_session(self):
+        """
+        Create a requests session that is shared by all calls made through this
+        API instance. Connections to netdot are pooled and kept alive between
+        calls, so only the first call pays for the TCP and TLS handshake.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self._headers)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        session.verify = self.verify
+        session.auth = self.auth
+        return session
+
+    def _request(self, method, resource, **kwargs):
         url = self.url + 'rest/' + resource
-        response = requests.get(url, cookies=self._get_cookies(), headers=self.HEADERS, verify=self.verify, auth=self.auth, **kwargs)
+        generation = self._ensure_login()
+        response = self.session.request(method, url, **kwargs)
         if response.status_code == 403:
-            response = requests.get(url, cookies=self._get_cookies(clear_cache=True), headers=self.HEADERS, verify=self.verify, auth=self.auth, **kwargs)
+            response.close()
+            self._ensure_login(expired=generation)
+            response = self.session.request(method, url, **kwargs)
         return response
 
-    def post(self, resource, params, **kwargs):
-        url = self.url + 'rest/' + resource
-        response = requests.post(url, cookies=self._get_cookies(), headers=self.HEADERS, params=params, verify=self.verify, auth=self.auth, **kwargs)
-        if response.status_code == 403:
-            response = requests.post(url, cookies=self._get_cookies(clear_cache=True), headers=self.HEADERS, params=params, verify=self.verify, auth=self.auth, **kwargs)
+    def get(self, resource, **kwargs):
+        cache = self.cache
+        # streamed responses are not cached, that would need the whole body
+        if cache is None or kwargs.get('stream') or cache.ttl(resource) is None:
+            return self._conditional_get(resource, **kwargs)
+        params = kwargs.get('params')
+        content = cache.get(resource, params)
+        if content is not None:
+            return CachedResponse(self.url + 'rest/' + resource, content)
+        response = self._conditional_get(resource, **kwargs)
+        if response.status_code == 200:
+            cache.set(resource, params, response.content)
         return response
 
-    def delete(self, resource, **kwargs):
-        url = self.url + 'rest/' + resource
-        response = requests.delete(url, cookies=self._get_cookies(), headers=self.HEADERS, verify=self.verify, auth=self.auth, **kwargs)
-        if response.status_code == 403:
-            response = requests.delete(url, cookies=self._get_cookies(clear_cache=True), headers=self.HEADERS, verify=self.verify, auth=self.auth, **kwargs)
+    def _conditional_get(self, resource, **kwargs):
+        """
+        GET resource with validators of the previous response, if there was one.
+        On 304 Not Modified the previous body is returned with not_modified set.
+        Streamed responses are not remembered.
+        """
+        validators = self.validators
+        if validators is None or kwargs.get('stream'):
+            return self._request('GET', resource, **kwargs)
+        key = ResponseCache.key(resource, kwargs.get('params'))
+        headers = validators.headers(key)
+        if headers:
+            headers.update(kwargs.pop('headers', None) or {})
+            kwargs['headers'] = headers
+        response = self._request('GET', resource, **kwargs)
+        if response.status_code == 304:
+            entry = validators.get(key)
+            if entry is not None:
+                etag, last_modified, content = entry
+                response.close()
+                headers = {}
+                if etag:
+                    headers['ETag'] = etag
+                if last_modified:
+                    headers['Last-Modified'] = last_modified
+                return CachedResponse(response.url, content, not_modified=True, headers=headers)
+            # forgotten in the meantime, ask again without validators
+            kwargs.pop('headers', None)
+            response = self._request('GET', resource, **kwargs)
+        if response.status_code == 200:
+            validators.update(key, response)
         return response
 
-    def _get_cookies(self, clear_cache=False):
-        if clear_cache:
-            self._cookies = self._login()
-            return self._cookies
-        else:
-            if not self._cookies:
-                self._cookies = self._login()
-                return self._cookies
-            else:
-                return self._cookies
+    def post(self, resource, params, **kwargs):
+        if self.cache is not None:
+            self.cache.invalidate(resource)
+        return self._request('POST', resource, params=params, **kwargs)
+
+    def delete(self, resource, **kwargs):
+        if self.cache is not None:
+            self.cache.invalidate(resource)
+        return self._request('DELETE', resource, **kwargs)
+
+    def close(self):
+        """Close all pooled connections to netdot."""
+        self.session.close()
+
+    def _ensure_login(self, expired=None):
+        """
+        Log in if not logged in yet, or if login generation expired is still
+        the current one. The session is shared by several threads, when the
+        login expires all of them get a 403, but only the first one logs in
+        again. Returns the generation of the login in use.
+        """
+        generation = self._login_generation
+        if generation and generation != expired:
+            return generation
+        with self._login_lock:
+            # skip if another thread logged in while this one was waiting
+            if self._login_generation == generation:
+                self._login()
+                self._login_generation += 1
+            return self._login_generation
 
     def _login(self):
+        # Cookies of an expired login are not cleared, other threads may be
+        # sending requests with them. The session replaces them with the new
+        # ones from the response.
         if self.auth is None:
             login_url = self.url + 'NetdotLogin'
             username = self.username
@@ -74,16 +171,14 @@ class NetdotAPI(object):
                 'credential_1':password,
                 'permanent_session':1,
             }
-            response = requests.post(login_url, data=params, headers=self.HEADERS, allow_redirects=False, verify=self.verify, auth=self.auth)
+            response = self.session.post(login_url, data=params, allow_redirects=False)
             if response.ok:
                 logger.info('Logged into netdot with username %s' % username)
-                return response.cookies
             else:
                 raise AttributeError('Invalid Credentials: %s' % response)
         else:
-            response = requests.get(self.url, headers=self.HEADERS, allow_redirects=False, verify=self.verify, auth=self.auth)
+            response = self.session.get(self.url, allow_redirects=False)
             if response.ok:
                 logger.info('Logged into netdot with auth: %s' % self.auth)
-                return response.cookies
             else:
                 raise AttributeError('Authentication error: %s' % response)
@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import OrderedDict
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
+
+class ResponseCache(object):
+    """
+    Cache of netdot GET responses, stored in a SQLite database so it can be
+    shared by consecutive runs of scripts.
+
+    path: SQLite database file
+    ttls: dict mapping resource names (i.e. 'Entity', 'Product') to the number
+        of seconds their responses are valid for
+    default_ttl: seconds responses of resources not in ttls are valid for, if
+        None only resources listed in ttls are cached
+    max_entries: maximum number of cached responses, least recently used ones
+        are evicted first
+
+    Any POST or DELETE made through the API invalidates all cached responses
+    of that resource.
+    """
+
+    def __init__(self, path, ttls=None, default_ttl=None, max_entries=10000):
+        self.path = path
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        # sqlite3 is imported here, so importing pynetdot does not pay for it
+        import sqlite3
+        self._binary = sqlite3.Binary
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, resource TEXT, content BLOB, stored REAL, accessed REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_resource ON responses (resource)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    @staticmethod
+    def resource_name(resource):
+        """'Entity/5' -> 'Entity'"""
+        return resource.split('/', 1)[0]
+
+    @staticmethod
+    def key(resource, params=None):
+        """Cache key for resource and query params, independent of params order."""
+        if not params:
+            return resource
+        items = sorted((str(k), str(v)) for k, v in params.items())
+        return '%s?%s' % (resource, urlencode(items))
+
+    def ttl(self, resource):
+        return self.ttls.get(self.resource_name(resource), self.default_ttl)
+
+    def get(self, resource, params=None):
+        """Returns cached content or None if it is not cached or expired."""
+        ttl = self.ttl(resource)
+        if ttl is None:
+            return None
+        key = self.key(resource, params)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT content, stored FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            content, stored = row
+            if stored + ttl < now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                return None
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+        return bytes(content)
+
+    def set(self, resource, params, content):
+        if self.ttl(resource) is None:
+            return
+        key = self.key(resource, params)
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, resource, content, stored, accessed) VALUES (?, ?, ?, ?, ?)',
+                (key, self.resource_name(resource), self._binary(content), now, now))
+            count = self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            if count > self.max_entries:
+                self._db.execute(
+                    'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)',
+                    (count - self.max_entries,))
+
+    def invalidate(self, resource=None):
+        """
+        Remove cached responses of resource (i.e. 'Entity' or 'Entity/5', both
+        invalidate all Entity responses) or all responses if resource is None.
+        """
+        with self._lock:
+            if resource is None:
+                self._db.execute('DELETE FROM responses')
+            else:
+                self._db.execute('DELETE FROM responses WHERE resource = ?', (self.resource_name(resource),))
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+
+class Validators(object):
+    """
+    Remembers ETag and Last-Modified validators of GET responses, together
+    with their bodies, so requests can be made conditional and the body
+    reused when netdot answers 304 Not Modified.
+
+    max_entries: number of URLs remembered, least recently used ones are
+        forgotten first
+    max_bytes: total size of remembered bodies, least recently used ones
+        are forgotten first
+    max_content_size: larger bodies (i.e. of big searches) are not
+        remembered, their requests are not made conditional
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=16 * 1024 * 1024, max_content_size=1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_content_size = max_content_size
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def headers(self, key):
+        """Conditional request headers for key, empty if nothing is known."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, key):
+        """
+        Remembered (etag, last_modified, body) of key, marked as recently
+        used, or None.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._entries[key] = entry
+        return entry
+
+    def update(self, key, response):
+        """
+        Remember validators of a 200 response, forget key if it has none or
+        its body is too large.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        content = response.content if etag or last_modified else None
+        with self._lock:
+            self._forget(key)
+            if content is None or len(content) > self.max_content_size:
+                return
+            self._entries[key] = (etag, last_modified, content)
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._forget(next(iter(self._entries)))
+
+    def _forget(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[2])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachedResponse(object):
+    """
+    Stands in for a requests.Response when a response is served from cache.
+    not_modified is True if netdot confirmed the body with 304 Not Modified.
+    """
+    from_cache = True
+
+    def __init__(self, url, content, not_modified=False, status_code=200, headers=None):
+        self.url = url
+        self.content = content
+        self.not_modified = not_modified
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
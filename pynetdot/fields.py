@@ -1,14 +1,25 @@
-import pynetdot.models
-from dateutil import parser as datetime_parser
+import pynetdot
 from datetime import datetime, date
+import weakref
+from pynetdot import signals
+from pynetdot.netdot import DEFERRED, _fan_out
 
 class BaseField(object):
+    """
+    Fields are installed as data descriptors on model classes (see
+    netdot.NetdotMeta). Values are kept in the _values list of each instance,
+    at the position (index) of the field in _fields. Reading a field of an
+    unresolved object resolves it first. Writing a field records its original
+    value, so only modified fields need to be looked at to find out what
+    changed. Fields left DEFERRED are parsed from _attrs when first read.
+    """
     def __init__(self, name, **kwargs):
         if not name:
             raise Exception('Need to specify name')
         self.name = name
         self.default = kwargs.pop('default', None)
         self.display_name = kwargs.pop('display_name', name)
+        self.index = None
 
     def serialize(self, obj):
         value = getattr(obj, self.name)
@@ -21,10 +32,37 @@ class BaseField(object):
         else:
             return str(value)
 
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj._values
+        if values is None:
+            obj._resolve()
+            values = obj._values
+        value = values[self.index]
+        if value is DEFERRED:
+            self.parse(obj)
+            value = values[self.index]
+        return value
+
+    def __set__(self, obj, value):
+        if obj._values is None:
+            obj._resolve()
+        original_state = obj._original_state
+        if original_state is None:
+            original_state = obj._original_state = {}
+        if self.name not in original_state:
+            original_state[self.name] = self.raw(self.__get__(obj))
+        obj._values[self.index] = value
+
+    def store(self, obj, value):
+        """Set value of this field on obj without marking it as modified."""
+        obj._values[self.index] = value
+
     def parse(self, obj):
         value = obj._attrs.get(self.name, self.default)
         value = self._clean(value)
-        setattr(obj, self.name, value)
+        self.store(obj, value)
 
     def raw(self, v):
         return v
@@ -56,12 +94,66 @@ class BoolField(BaseField):
             return '0'
         return v
 
+# Timestamps repeat a lot within a response (i.e. ArpCache, FWTable), so
+# recently parsed ones are kept, up to DATE_CACHE_SIZE of each kind. Values
+# are immutable, so equal timestamps share a single object.
+DATE_CACHE_SIZE = 10000
+_date_cache = {}
+_datetime_cache = {}
+
+def _iso_date(v):
+    # netdot sends dates as YYYY-MM-DD
+    if len(v) != 10 or v[4] != '-' or v[7] != '-':
+        raise ValueError(v)
+    return date(int(v[0:4]), int(v[5:7]), int(v[8:10]))
+
+def _iso_datetime(v):
+    # and timestamps as YYYY-MM-DD HH:MM:SS
+    if len(v) != 19 or v[4] != '-' or v[7] != '-' or v[10] != ' ' or v[13] != ':' or v[16] != ':':
+        raise ValueError(v)
+    return datetime(int(v[0:4]), int(v[5:7]), int(v[8:10]), int(v[11:13]), int(v[14:16]), int(v[17:19]))
+
+def _cached(cache, v, parse):
+    try:
+        return cache[v]
+    except KeyError:
+        pass
+    value = parse(v)
+    if len(cache) >= DATE_CACHE_SIZE:
+        cache.clear()
+    cache[v] = value
+    return value
+
+def _parse_date(v):
+    try:
+        return _iso_date(v)
+    except ValueError:
+        pass
+    # other formats are left to dateutil
+    from dateutil import parser as datetime_parser
+    return datetime_parser.parse(v).date()
+
+def _parse_datetime(v):
+    try:
+        value = _iso_datetime(v)
+    except ValueError:
+        from dateutil import parser as datetime_parser
+        try:
+            value = datetime_parser.parse(v, dayfirst=True)
+        except:
+            return None
+    if value.year == 1970:
+        # if there is no timestamp the field will contain:
+        # '1970-01-02 00:00:01'
+        # yes, this is a bit of a hack
+        return None
+    return value
+
 class DateField(BaseField):
     def _clean(self, v):
         if not v or v == '' or v == '0000-00-00':
             return None
-        date = datetime_parser.parse(v)
-        return date.date()
+        return _cached(_date_cache, v, _parse_date)
 
     # TODO serialize
 
@@ -76,16 +168,7 @@ class DateTimeField(BaseField):
     def _clean(self, v):
         if not v or v == '':
             return None
-        try:
-            date = datetime_parser.parse(v, dayfirst=True)
-        except:
-            return None
-        if date.year == 1970:
-            # if there is no timestamp the field will contain:
-            # '1970-01-02 00:00:01'
-            # yes, this is a bit of a hack
-            return None
-        return date
+        return _cached(_datetime_cache, v, _parse_datetime)
 
     # TODO serialize
 
@@ -114,6 +197,14 @@ class LinkField(BaseField):
     def __init__(self, name, **kwargs):
         self.link_to = kwargs.pop('link_to')
         super(LinkField, self).__init__(name, **kwargs)
+        self._link_class = None
+
+    @property
+    def link_class(self):
+        """Model class linked to, looked up once."""
+        if self._link_class is None:
+            self._link_class = getattr(pynetdot.models, self.link_to)
+        return self._link_class
 
     def serialize(self, obj):
         value = getattr(obj, self.name)
@@ -131,12 +222,10 @@ class LinkField(BaseField):
         xlink = '%s_xlink' % self.name
         link = obj._attrs.get(xlink, None)
         if not link:
-            setattr(obj, self.name, None)
+            self.store(obj, None)
             return None
-        link_id = int(link.replace('%s/' % self.link_to, ''))
-        class_ = getattr(pynetdot.models, self.link_to)
-        linked_obj = class_(id=link_id)
-        setattr(obj, self.name, linked_obj)
+        linked_obj = self.link_class._instance(int(link[len(self.link_to) + 1:]))
+        self.store(obj, linked_obj)
 
     def raw(self, v):
         if hasattr(v, 'id'):
@@ -144,3 +233,172 @@ class LinkField(BaseField):
         elif not v:
             return None
         return int(v)
+
+def compile_parser(fields):
+    """
+    Returns a function(obj, attrs, links) setting values of fields on obj
+    from attributes of a netdot XML row. It does the same as calling parse of
+    each field, with the conversion of common field types written out inline,
+    so a row is parsed without a method call per field. Fields of other types
+    (i.e. subclasses) are parsed by their own parse method.
+
+    links is a dict of linked objects by xlink shared by the rows of one
+    response, so rows linking to the same object share one instance of it.
+    """
+    lines = [
+        'def parse_row(obj, attrs, links):',
+        '    get = attrs.get',
+        '    values = obj._values = [None] * %d' % len(fields),
+    ]
+    namespace = {'fields': fields}
+    for i, field in enumerate(fields):
+        namespace['d%d' % i] = field.default
+        get = 'get(%r, d%d)' % (field.name, i)
+        kind = type(field)
+        if kind is StringField:
+            lines.append('    values[%d] = %s' % (i, get))
+        elif kind is IntegerField:
+            lines.append('    v = %s' % get)
+            lines.append("    values[%d] = None if v == '' else int(v)" % i)
+        elif kind is BoolField:
+            lines.append('    v = %s' % get)
+            lines.append("    values[%d] = False if v == '0' else bool(v)" % i)
+        elif kind in (DateField, DateTimeField):
+            namespace['clean%d' % i] = field._clean
+            lines.append('    values[%d] = clean%d(%s)' % (i, i, get))
+        elif kind is LinkField:
+            namespace['link%d' % i] = field.link_class._instance
+            lines.append('    v = get(%r)' % ('%s_xlink' % field.name))
+            lines.append('    if v:')
+            lines.append('        linked = links.get(v)')
+            lines.append('        if linked is None:')
+            lines.append('            linked = links[v] = link%d(int(v[%d:]))' % (i, len(field.link_to) + 1))
+            lines.append('        values[%d] = linked' % i)
+        else:
+            lines.append('    fields[%d].parse(obj)' % i)
+    exec(compile('\n'.join(lines), '<parse_row>', 'exec'), namespace)
+    return namespace['parse_row']
+
+# generation of each model, incremented when one of its objects is saved or
+# deleted through pynetdot, so cached related objects are fetched again
+_generations = {}
+
+def _invalidate_related(sender, instance):
+    _generations[sender.__name__] = _generations.get(sender.__name__, 0) + 1
+
+signals.post_save.connect(_invalidate_related)
+signals.post_delete.connect(_invalidate_related)
+
+
+class ReverseLink(object):
+    """
+    Attribute listing objects of class link_from whose field links to this
+    object. These are the reverse side of LinkFields. The objects are
+    searched for when first used and kept in a RelatedSet on the object.
+    """
+    def __init__(self, link_from, field):
+        self.link_from = link_from
+        self.field = field
+        self.name = None
+
+    @property
+    def link_class(self):
+        return getattr(pynetdot.models, self.link_from)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.related(obj)
+
+    def __set__(self, obj, value):
+        raise AttributeError("can't set attribute")
+
+    def related(self, obj):
+        """RelatedSet of obj for this link, created on first use."""
+        name = self._name(type(obj))
+        related = obj.__dict__.get(name)
+        if related is None:
+            related = obj.__dict__[name] = RelatedSet(self, obj)
+        return related
+
+    def prefetch(self, objects, max_workers=None):
+        """Fetch related objects of all objects concurrently."""
+        generation = _generations.get(self.link_from, 0)
+        owners = [obj for obj in objects if obj.id]
+        link_class = self.link_class
+        results = _fan_out(lambda obj: link_class.search(**{self.field: obj.id}), owners, max_workers)
+        for obj, related in zip(owners, results):
+            self.related(obj)._set(related, generation)
+
+    def _name(self, cls):
+        # name of the attribute this link is installed as
+        if self.name is None:
+            for klass in cls.__mro__:
+                for name, value in vars(klass).items():
+                    if value is self:
+                        self.name = name
+        return self.name
+
+    def __repr__(self):
+        return '%s(%s.%s)' % (self.__class__.__name__, self.link_from, self.field)
+
+
+class RelatedSet(object):
+    """
+    List-like collection of the objects linking to an object through a
+    ReverseLink. They are searched for when first used and kept until
+    refresh is called or an object of their class is saved or deleted.
+    """
+    def __init__(self, link, owner):
+        self.link = link
+        self._owner = weakref.ref(owner)
+        self._objects = None
+        self._generation = None
+
+    def _get(self):
+        generation = _generations.get(self.link.link_from, 0)
+        if self._objects is None or self._generation != generation:
+            owner = self._owner()
+            if owner is None or not owner.id:
+                # objects can only link to objects saved in netdot
+                objects = []
+            else:
+                objects = self.link.link_class.search(**{self.link.field: owner.id})
+            self._set(objects, generation)
+        return self._objects
+
+    def _set(self, objects, generation):
+        self._objects = objects
+        self._generation = generation
+
+    def refresh(self):
+        """Forget related objects, they are searched for again when used."""
+        self._objects = None
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __len__(self):
+        return len(self._get())
+
+    def __getitem__(self, index):
+        return self._get()[index]
+
+    def __contains__(self, obj):
+        return obj in self._get()
+
+    def __bool__(self):
+        return bool(self._get())
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        if isinstance(other, RelatedSet):
+            other = other._get()
+        return self._get() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(self._get())
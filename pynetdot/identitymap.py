@@ -0,0 +1,73 @@
+import threading
+import weakref
+from collections import deque
+
+
+class IdentityMap(object):
+    """
+    Map of (resource, id) to model instances. Objects fetched from netdot or
+    referenced by links are created only once while something references them,
+    so resolving one copy serves all references to it.
+
+    Values are weak references, objects no longer used anywhere else drop out
+    of the map by themselves. The map is bounded to max_size entries, the
+    oldest entries are forgotten first.
+    """
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self._objects = weakref.WeakValueDictionary()
+        self._order = deque()
+        self._lock = threading.Lock()
+
+    def get(self, resource, id):
+        return self._objects.get((resource, id))
+
+    def get_or_create(self, cls, id):
+        """Return the instance of cls for id, create an unresolved one if needed."""
+        key = (cls.resource, id)
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is None:
+                obj = cls(id=id)
+                self._store(key, obj)
+            return obj
+
+    def add(self, obj):
+        """
+        Add obj to the map. Returns the instance already in the map for the
+        same object if there is one, obj otherwise.
+        """
+        key = (obj.resource, obj.id)
+        with self._lock:
+            existing = self._objects.get(key)
+            if existing is not None:
+                return existing
+            self._store(key, obj)
+            return obj
+
+    def discard(self, obj):
+        key = (obj.resource, obj.id)
+        with self._lock:
+            if self._objects.get(key) is obj:
+                del self._objects[key]
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
+            self._order.clear()
+
+    def _store(self, key, obj):
+        self._objects[key] = obj
+        self._order.append(key)
+        while len(self._objects) > self.max_size:
+            self._objects.pop(self._order.popleft(), None)
+        if len(self._order) > 2 * self.max_size:
+            # forget keys of objects that were already garbage collected
+            self._order = deque(k for k in self._order if k in self._objects)
+
+    def __contains__(self, key):
+        return key in self._objects
+
+    def __len__(self):
+        return len(self._objects)
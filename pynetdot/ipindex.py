@@ -0,0 +1,289 @@
+"""
+In-memory index of Ipblocks for fast prefix lookups without netdot.
+
+Blocks are kept in a path-compressed binary trie per IP version, so finding
+the longest prefix containing an address takes at most one step per stored
+prefix on the way down, instead of a GET per parent.
+"""
+from __future__ import absolute_import, division
+from collections import namedtuple
+import ipaddress
+import socket
+import struct
+import threading
+from builtins import str
+from . import signals
+
+# network is an ipaddress network, parent and status are ids of the linked
+# Ipblock and IpblockStatus, status_name is the name of the status
+Entry = namedtuple('Entry', ['id', 'network', 'parent', 'status', 'status_name'])
+
+
+class _Node(object):
+    __slots__ = ('key', 'prefix', 'entry', 'children')
+
+    def __init__(self, key, prefix, entry=None):
+        self.key = key
+        self.prefix = prefix
+        self.entry = entry
+        self.children = [None, None]
+
+
+def _network(network):
+    if isinstance(network, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return network
+    return ipaddress.ip_network(str(network), strict=False)
+
+def _address(address):
+    """IP version and integer value of address."""
+    if isinstance(address, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+        return address.version, int(address)
+    try:
+        # much faster than ipaddress for the common case
+        return 4, struct.unpack('!I', socket.inet_pton(socket.AF_INET, address))[0]
+    except (socket.error, TypeError, ValueError):
+        address = ipaddress.ip_address(str(address))
+        return address.version, int(address)
+
+def _link_id(value):
+    if value is None:
+        return None
+    if hasattr(value, 'id'):
+        return value.id
+    return int(value)
+
+
+class _Trie(object):
+    def __init__(self, bits):
+        self.bits = bits
+        self.root = _Node(0, 0)
+
+    def _bit(self, key, position):
+        return (key >> (self.bits - position - 1)) & 1
+
+    def _common(self, key, prefix, node):
+        """Length of common prefix of key/prefix and node."""
+        length = min(prefix, node.prefix)
+        diff = (key ^ node.key) >> (self.bits - length) if length else 0
+        while diff:
+            length -= 1
+            diff >>= 1
+        return length
+
+    def _mask(self, key, prefix):
+        host_bits = self.bits - prefix
+        return (key >> host_bits) << host_bits
+
+    def insert(self, key, prefix, entry):
+        node = self.root
+        if prefix == 0:
+            node.entry = entry
+            return
+        while True:
+            bit = self._bit(key, node.prefix)
+            child = node.children[bit]
+            if child is None:
+                node.children[bit] = _Node(key, prefix, entry)
+                return
+            common = self._common(key, prefix, child)
+            if common == child.prefix:
+                if prefix == child.prefix:
+                    child.entry = entry
+                    return
+                node = child
+                continue
+            new = _Node(key, prefix, entry)
+            if common == prefix:
+                # new prefix contains child
+                new.children[self._bit(child.key, prefix)] = child
+                node.children[bit] = new
+            else:
+                glue = _Node(self._mask(key, common), common)
+                glue.children[self._bit(child.key, common)] = child
+                glue.children[self._bit(key, common)] = new
+                node.children[bit] = glue
+            return
+
+    def find(self, key, prefix):
+        """Node of exactly key/prefix, or None."""
+        node = self.root
+        while node.prefix < prefix:
+            node = node.children[self._bit(key, node.prefix)]
+            if node is None or node.prefix > prefix or self._common(key, prefix, node) < node.prefix:
+                return None
+        if node.prefix == prefix and node.key == key:
+            return node
+        return None
+
+    def remove(self, key, prefix):
+        path = []
+        node = self.root
+        while node is not None and node.prefix < prefix:
+            bit = self._bit(key, node.prefix)
+            path.append((node, bit))
+            node = node.children[bit]
+        if node is None or node.prefix != prefix or node.key != key:
+            return
+        node.entry = None
+        # drop nodes that no longer hold an entry or join two branches
+        while path and node.entry is None:
+            parent, bit = path.pop()
+            children = [c for c in node.children if c is not None]
+            if len(children) > 1:
+                break
+            parent.children[bit] = children[0] if children else None
+            node = parent
+
+    def longest_match(self, key, max_prefix):
+        bits = self.bits
+        node = self.root
+        best = node.entry
+        while node.prefix < max_prefix:
+            node = node.children[(key >> (bits - node.prefix - 1)) & 1]
+            if node is None or node.prefix > max_prefix:
+                break
+            if (key ^ node.key) >> (bits - node.prefix):
+                break
+            if node.entry is not None:
+                best = node.entry
+        return best
+
+    def children(self, node):
+        """Entries below node with no other entry between them and node."""
+        found = []
+        stack = [c for c in reversed(node.children) if c is not None]
+        while stack:
+            child = stack.pop()
+            if child.entry is not None:
+                found.append(child.entry)
+            else:
+                stack.extend(c for c in reversed(child.children) if c is not None)
+        return found
+
+
+class IpIndex(object):
+    """
+    Index of Ipblocks by network. Build it with load, then look up blocks
+    without talking to netdot. Call watch to keep it up to date with Ipblocks
+    saved and deleted through pynetdot.
+
+    Networks and addresses can be given as strings or ipaddress objects.
+    """
+    def __init__(self):
+        self._tries = {4: _Trie(32), 6: _Trie(128)}
+        self._by_id = {}
+        self._statuses = {}
+        self._lock = threading.Lock()
+
+    def load(self, page_size=None):
+        """Replace the contents of the index with all Ipblocks in netdot."""
+        from .models import Ipblock, IpblockStatus
+        self._statuses = dict((s.id, s.name) for s in IpblockStatus.all())
+        with self._lock:
+            self._tries = {4: _Trie(32), 6: _Trie(128)}
+            self._by_id = {}
+        for block in Ipblock.iter_all(page_size=page_size):
+            self.add(block)
+        return self
+
+    def add(self, block):
+        """Add or update Ipblock block."""
+        network = _network('%s/%s' % (block.address, block.prefix))
+        status = _link_id(block.status)
+        entry = Entry(block.id, network, _link_id(block.parent), status, self._statuses.get(status))
+        trie = self._tries[network.version]
+        with self._lock:
+            old = self._by_id.pop(block.id, None)
+            if old is not None:
+                self._tries[old.network.version].remove(int(old.network.network_address), old.network.prefixlen)
+            trie.insert(int(network.network_address), network.prefixlen, entry)
+            self._by_id[block.id] = entry
+
+    def remove(self, id):
+        """Remove Ipblock with id."""
+        with self._lock:
+            entry = self._by_id.pop(id, None)
+            if entry is not None:
+                network = entry.network
+                self._tries[network.version].remove(int(network.network_address), network.prefixlen)
+
+    def get(self, network):
+        """Entry of exactly network or None."""
+        network = _network(network)
+        node = self._tries[network.version].find(int(network.network_address), network.prefixlen)
+        return node.entry if node is not None else None
+
+    def lookup(self, address, max_prefix=None):
+        """
+        Entry of the most specific block containing address, or None. With
+        max_prefix only blocks with prefix length up to it are considered,
+        i.e. max_prefix=31 finds the subnet of a host address.
+        """
+        version, key = _address(address)
+        trie = self._tries[version]
+        if max_prefix is None:
+            max_prefix = trie.bits
+        return trie.longest_match(key, max_prefix)
+
+    def children(self, network):
+        """Entries of blocks directly within network, ordered by address."""
+        network = _network(network)
+        trie = self._tries[network.version]
+        node = trie.root
+        key = int(network.network_address)
+        prefix = network.prefixlen
+        # find the node at or right below network
+        while node.prefix < prefix:
+            node = node.children[trie._bit(key, node.prefix)]
+            if node is None:
+                return []
+            if trie._common(key, prefix, node) < min(prefix, node.prefix):
+                return []
+        if node.prefix > prefix:
+            return [node.entry] if node.entry is not None else trie.children(node)
+        return trie.children(node)
+
+    def free_space(self, network):
+        """List of networks within network not used by any block."""
+        network = _network(network)
+        free = []
+        start = int(network.network_address)
+        end = int(network.broadcast_address)
+        cls = type(network.network_address)
+        for entry in self.children(network):
+            first = int(entry.network.network_address)
+            if first > start:
+                free.extend(ipaddress.summarize_address_range(cls(start), cls(first - 1)))
+            start = int(entry.network.broadcast_address) + 1
+        if start <= end:
+            free.extend(ipaddress.summarize_address_range(cls(start), cls(end)))
+        return free
+
+    def utilisation(self, network):
+        """Share of addresses in network used by blocks within it, 0 to 1."""
+        network = _network(network)
+        used = sum(entry.network.num_addresses for entry in self.children(network))
+        return used / network.num_addresses
+
+    def watch(self):
+        """Update the index when Ipblocks are saved or deleted through pynetdot."""
+        from .models import Ipblock
+        signals.post_save.connect(self._saved, sender=Ipblock)
+        signals.post_delete.connect(self._deleted, sender=Ipblock)
+
+    def unwatch(self):
+        from .models import Ipblock
+        signals.post_save.disconnect(self._saved, sender=Ipblock)
+        signals.post_delete.disconnect(self._deleted, sender=Ipblock)
+
+    def _saved(self, sender, instance):
+        self.add(instance)
+
+    def _deleted(self, sender, instance):
+        self.remove(instance.id)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, network):
+        return self.get(network) is not None
@@ -0,0 +1,223 @@
+"""
+Local copy of netdot objects in a SQLite database.
+
+Each mirrored model gets a table named after it, with an id column and a
+column for each of its fields. Link fields are INTEGER columns referencing
+the id of the linked table, so objects can be joined with plain SQL:
+
+    SELECT d.id, i.name FROM Device d JOIN Interface i ON i.device = d.id
+
+Models can also be searched as usual, without netdot, after calling use.
+"""
+from __future__ import absolute_import
+import json
+import sqlite3
+import threading
+from xml.sax.saxutils import quoteattr
+from . import fields as f
+from .cache import CachedResponse
+
+# column types of fields, TEXT for those not listed
+COLUMN_TYPES = [
+    (f.LinkField, 'INTEGER'),
+    (f.IntegerField, 'INTEGER'),
+    (f.BoolField, 'INTEGER'),
+]
+
+
+def _quote(name):
+    return '"%s"' % name.replace('"', '""')
+
+def _column_type(field):
+    for cls, type_ in COLUMN_TYPES:
+        if isinstance(field, cls):
+            return type_
+    return 'TEXT'
+
+def _model(model):
+    if isinstance(model, type):
+        return model
+    from . import models
+    return getattr(models, model)
+
+
+class Mirror(object):
+    """
+    Netdot objects of selected models copied to a SQLite database file.
+
+    snapshot copies all objects of models. To keep the copy current, pass
+    the mirror as store to pynetdot.Sync.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS _state (key TEXT PRIMARY KEY, value TEXT)')
+        self._tables = set(
+            row[0] for row in self._db.execute("SELECT name FROM sqlite_master WHERE type = 'table'"))
+
+    @staticmethod
+    def schema(model):
+        """SQL statements creating the table and indexes of model."""
+        cls = _model(model)
+        table = cls.__name__
+        columns = ['id INTEGER PRIMARY KEY']
+        indexes = []
+        for field in cls._fields:
+            column = '%s %s' % (_quote(field.name), _column_type(field))
+            if isinstance(field, f.LinkField):
+                column += ' REFERENCES %s (id)' % _quote(field.link_to)
+                indexes.append('CREATE INDEX IF NOT EXISTS %s ON %s (%s)' % (
+                    _quote('%s_%s' % (table, field.name)), _quote(table), _quote(field.name)))
+            columns.append(column)
+        return ['CREATE TABLE IF NOT EXISTS %s (%s)' % (_quote(table), ', '.join(columns))] + indexes
+
+    def _create_table(self, cls, drop=False):
+        if drop:
+            self._db.execute('DROP TABLE IF EXISTS %s' % _quote(cls.__name__))
+        for statement in self.schema(cls):
+            self._db.execute(statement)
+        self._tables.add(cls.__name__)
+
+    def _insert_sql(self, cls):
+        columns = ['id'] + [field.name for field in cls._fields]
+        return 'INSERT OR REPLACE INTO %s (%s) VALUES (%s)' % (
+            _quote(cls.__name__), ', '.join(_quote(c) for c in columns), ', '.join('?' * len(columns)))
+
+    def snapshot(self, models, page_size=None):
+        """
+        Replace mirrored objects of models (classes or names) with all their
+        objects currently in netdot.
+        """
+        for model in models:
+            cls = _model(model)
+            names = [field.name for field in cls._fields]
+
+            def rows():
+                for obj in cls.iter_all(page_size=page_size):
+                    values = obj._as_dict()
+                    yield [obj.id] + [values[name] for name in names]
+
+            with self._lock:
+                with self._db:
+                    self._create_table(cls, drop=True)
+                    self._db.executemany(self._insert_sql(cls), rows())
+
+    def query(self, sql, params=()):
+        """Run SQL on the mirror and return all result rows."""
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def use(self):
+        """
+        Make models read objects from the mirror instead of netdot, until
+        pynetdot.setup is called again. Saving and deleting is not possible.
+        """
+        from . import netdot
+        netdot.api = MirrorAPI(self)
+
+    def close(self):
+        self._db.close()
+
+    # store interface of pynetdot.Sync
+
+    def put(self, model, id, attrs):
+        cls = _model(model)
+        with self._lock:
+            with self._db:
+                if cls.__name__ not in self._tables:
+                    self._create_table(cls)
+                self._db.execute(self._insert_sql(cls), [id] + [attrs[field.name] for field in cls._fields])
+
+    def delete(self, model, id):
+        name = _model(model).__name__
+        if name not in self._tables:
+            return
+        with self._lock:
+            with self._db:
+                self._db.execute('DELETE FROM %s WHERE id = ?' % _quote(name), (id,))
+
+    def get_state(self, key):
+        row = self.query('SELECT value FROM _state WHERE key = ?', (key,))
+        if not row:
+            return None
+        return json.loads(row[0][0])
+
+    def set_state(self, key, value):
+        with self._lock:
+            with self._db:
+                self._db.execute('INSERT OR REPLACE INTO _state (key, value) VALUES (?, ?)', (key, json.dumps(value)))
+
+    # responses for MirrorAPI
+
+    def _rows(self, cls, params):
+        where = []
+        values = []
+        limit = params.pop('limit', None)
+        offset = params.pop('offset', None)
+        columns = set(['id'] + [field.name for field in cls._fields])
+        for name, value in sorted(params.items()):
+            if name not in columns:
+                raise Exception('%s has no field %s' % (cls.__name__, name))
+            if isinstance(value, bool):
+                value = int(value)
+            where.append('%s = ?' % _quote(name))
+            values.append(value)
+        sql = 'SELECT * FROM %s' % _quote(cls.__name__)
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY id'
+        if limit:
+            sql += ' LIMIT %d OFFSET %d' % (int(limit), int(offset or 0))
+        return self.query(sql, values)
+
+    @staticmethod
+    def _row_xml(cls, tag, row):
+        """Row in the form netdot sends objects in, so models can parse it."""
+        attrs = ['id="%d"' % row[0]]
+        for field, value in zip(cls._fields, row[1:]):
+            if value is None:
+                value = ''
+            if isinstance(field, f.LinkField) and value != '':
+                attrs.append('%s_xlink=%s' % (field.name, quoteattr('%s/%s' % (field.link_to, value))))
+            attrs.append('%s=%s' % (field.name, quoteattr('%s' % value)))
+        return '<%s %s/>' % (tag, ' '.join(attrs))
+
+
+class MirrorAPI(object):
+    """
+    Answers GET requests of models from a Mirror, in place of NetdotAPI.
+    """
+    identity_map = None
+    cache = None
+    pool_size = 1
+
+    def __init__(self, mirror):
+        self.mirror = mirror
+
+    def get(self, resource, params=None, **kwargs):
+        name, _, id = resource.partition('/')
+        cls = _model(name)
+        if name not in self.mirror._tables:
+            raise Exception('%s is not mirrored' % name)
+        url = 'mirror:%s' % resource
+        if id:
+            rows = self.mirror._rows(cls, {'id': int(id)})
+            if not rows:
+                return CachedResponse(url, b'', status_code=404)
+            xml = self.mirror._row_xml(cls, 'opt', rows[0])
+        else:
+            rows = self.mirror._rows(cls, dict(params or {}))
+            if not rows:
+                return CachedResponse(url, b'', status_code=404)
+            xml = '<opt>%s</opt>' % ''.join(self.mirror._row_xml(cls, name, row) for row in rows)
+        return CachedResponse(url, ('<?xml version="1.0" encoding="UTF-8"?>\n' + xml).encode('utf-8'))
+
+    def post(self, resource, params, **kwargs):
+        raise Exception('Can not save to a mirror')
+
+    def delete(self, resource, **kwargs):
+        raise Exception('Can not delete from a mirror')
+
+    def close(self):
+        pass
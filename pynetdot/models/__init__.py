@@ -1,7 +1,8 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 import sys
-import inspect
+import threading
 from . import base
+from ..netdot import _fan_out
 
 # Add custom behaviour to some class:
 #class Device(base.BaseDevice):
@@ -13,23 +14,90 @@ class RR(base.BaseRR):
     def label(self):
         return '%s.%s' % (self.name, self.zone)
 
+class IpblockNode(object):
+    """Node of a tree of Ipblocks returned by Ipblock.subtree."""
+    __slots__ = ('block', 'parent', 'children')
+
+    def __init__(self, block, parent=None):
+        self.block = block
+        self.parent = parent
+        self.children = []
+
+    def walk(self):
+        """Yield this node and all nodes below it, depth first."""
+        yield self
+        for child in self.children:
+            for node in child.walk():
+                yield node
+
+    def __repr__(self):
+        return 'IpblockNode(%r, %d children)' % (self.block, len(self.children))
+
 class Ipblock(base.BaseIpblock):
+    # prefix length of a single address of each IP version
+    HOST_PREFIX = {4: 32, 6: 128}
+
     @property
     def label(self):
         return '%s/%s' % (self.address, self.prefix)
 
+    def subtree(self, max_depth=None, max_workers=None):
+        """
+        Fetch all blocks below this one and return them as a tree of
+        IpblockNode objects, with this block at the root. The tree is fetched
+        one level at a time, searching for children of all blocks of a level
+        concurrently, so the time it takes grows with the depth of the tree
+        rather than the number of blocks in it. Single addresses are assumed
+        to have no children.
+        """
+        root = IpblockNode(self)
+        level = [root]
+        depth = 0
+        while level and (max_depth is None or depth < max_depth):
+            parents = [node for node in level if node.block.prefix != self.HOST_PREFIX.get(node.block.version)]
+            results = _fan_out(lambda node: Ipblock.search(parent=node.block.id), parents, max_workers)
+            level = []
+            for node, children in zip(parents, results):
+                node.children = [IpblockNode(child, node) for child in children]
+                level.extend(node.children)
+            depth += 1
+        return root
+
+class Audit(base.BaseAudit):
+    @property
+    def label(self):
+        # the label property hides the label field, read the field directly
+        label = self._fields_by_name['label'].__get__(self, Audit)
+        return ' '.join([str(v) for v in [self.tstamp, self.username, label]]).strip()
+
 class Device(base.BaseDevice):
     def pre_save_params_clean(self, params):
         # netdot server api expects hostnames in string form, not as an id of a RR object
         if 'name' in params and not self.id:
             params['name'] = str(self.name)
 
-# Generate classes for each class in base module. But skip those already
-# defined in this module.
-my_classes = inspect.getmembers(sys.modules[__name__], inspect.isclass)
-my_names = [n for n,_ in my_classes]
-for base_name, cls in inspect.getmembers(base, inspect.isclass):
-    name = base_name.replace('Base', '')
-    if name in my_names:
-        continue
-    globals()[name] = type(str(name), (cls,), {})
+# Classes for each class in base module, except those already defined in this
+# module, are generated the first time they are used (see __getattr__).
+__all__ = sorted(name[len('Base'):] for name in vars(base) if name.startswith('Base'))
+_generate_lock = threading.Lock()
+
+def _generate(name):
+    with _generate_lock:
+        cls = globals().get(name)
+        if cls is None:
+            cls = type(str(name), (getattr(base, 'Base%s' % name),), {'__module__': __name__})
+            globals()[name] = cls
+        return cls
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    return _generate(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ (PEP 562), generate all classes now
+    for name in __all__:
+        _generate(name)
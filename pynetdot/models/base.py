@@ -26,10 +26,7 @@ class BaseArpCache(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['tstamp', 'device']])
         return l.strip()
 
-    @property
-    def entries(self):
-        cls = getattr(pynetdot.models, 'ArpCacheEntry')
-        return cls.search(arpcache=self.id)
+    entries = f.ReverseLink('ArpCacheEntry', 'arpcache')
 
 
 class BaseArpCacheEntry(n.Netdot):
@@ -85,15 +82,8 @@ class BaseASN(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['number']])
         return l.strip()
 
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(bgplocalas=self.id)
-
-    @property
-    def ipblocks(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(asn=self.id)
+    devices = f.ReverseLink('Device', 'bgplocalas')
+    ipblocks = f.ReverseLink('Ipblock', 'asn')
 
 
 class BaseAsset(n.Netdot):
@@ -142,15 +132,8 @@ class BaseAsset(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['product_id', 'serial_number', 'physaddr']])
         return l.strip()
 
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(asset_id=self.id)
-
-    @property
-    def device_modules(self):
-        cls = getattr(pynetdot.models, 'DeviceModule')
-        return cls.search(asset_id=self.id)
+    devices = f.ReverseLink('Device', 'asset_id')
+    device_modules = f.ReverseLink('DeviceModule', 'asset_id')
 
 
 class BaseAudit(n.Netdot):
@@ -213,30 +196,11 @@ class BaseAvailability(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def page_notifications(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(notify_email=self.id)
-
-    @property
-    def page_notifications(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(notify_pager=self.id)
-
-    @property
-    def page_notifications(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(notify_voice=self.id)
-
-    @property
-    def entities(self):
-        cls = getattr(pynetdot.models, 'Entity')
-        return cls.search(availability=self.id)
-
-    @property
-    def sites(self):
-        cls = getattr(pynetdot.models, 'Site')
-        return cls.search(availability=self.id)
+    page_notifications = f.ReverseLink('Contact', 'notify_email')
+    page_notifications = f.ReverseLink('Contact', 'notify_pager')
+    page_notifications = f.ReverseLink('Contact', 'notify_voice')
+    entities = f.ReverseLink('Entity', 'availability')
+    sites = f.ReverseLink('Site', 'availability')
 
 
 class BaseBackboneCable(n.Netdot):
@@ -274,10 +238,7 @@ class BaseBackboneCable(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def strands(self):
-        cls = getattr(pynetdot.models, 'CableStrand')
-        return cls.search(cable=self.id)
+    strands = f.ReverseLink('CableStrand', 'cable')
 
 
 class BaseBGPPeering(n.Netdot):
@@ -359,15 +320,8 @@ class BaseCableStrand(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def splices(self):
-        cls = getattr(pynetdot.models, 'Splice')
-        return cls.search(strand1=self.id)
-
-    @property
-    def splices2(self):
-        cls = getattr(pynetdot.models, 'Splice')
-        return cls.search(strand2=self.id)
+    splices = f.ReverseLink('Splice', 'strand1')
+    splices2 = f.ReverseLink('Splice', 'strand2')
 
 
 class BaseCableType(n.Netdot):
@@ -393,15 +347,8 @@ class BaseCableType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def backbonecables(self):
-        cls = getattr(pynetdot.models, 'BackboneCable')
-        return cls.search(type=self.id)
-
-    @property
-    def horizontalcables(self):
-        cls = getattr(pynetdot.models, 'HorizontalCable')
-        return cls.search(type=self.id)
+    backbonecables = f.ReverseLink('BackboneCable', 'type')
+    horizontalcables = f.ReverseLink('HorizontalCable', 'type')
 
 
 class BaseCircuit(n.Netdot):
@@ -445,15 +392,8 @@ class BaseCircuit(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['cid']])
         return l.strip()
 
-    @property
-    def strands(self):
-        cls = getattr(pynetdot.models, 'CableStrand')
-        return cls.search(circuit_id=self.id)
-
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(circuit=self.id)
+    strands = f.ReverseLink('CableStrand', 'circuit_id')
+    interfaces = f.ReverseLink('Interface', 'circuit')
 
 
 class BaseCircuitStatus(n.Netdot):
@@ -478,10 +418,7 @@ class BaseCircuitStatus(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def circuits(self):
-        cls = getattr(pynetdot.models, 'Circuit')
-        return cls.search(status=self.id)
+    circuits = f.ReverseLink('Circuit', 'status')
 
 
 class BaseCircuitType(n.Netdot):
@@ -506,10 +443,7 @@ class BaseCircuitType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def circuits(self):
-        cls = getattr(pynetdot.models, 'Circuit')
-        return cls.search(type=self.id)
+    circuits = f.ReverseLink('Circuit', 'type')
 
 
 class BaseCloset(n.Netdot):
@@ -574,20 +508,9 @@ class BaseCloset(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name', 'room']])
         return l.strip()
 
-    @property
-    def backbones_end(self):
-        cls = getattr(pynetdot.models, 'BackboneCable')
-        return cls.search(end_closet=self.id)
-
-    @property
-    def backbones_start(self):
-        cls = getattr(pynetdot.models, 'BackboneCable')
-        return cls.search(start_closet=self.id)
-
-    @property
-    def horizontalcables(self):
-        cls = getattr(pynetdot.models, 'HorizontalCable')
-        return cls.search(closet=self.id)
+    backbones_end = f.ReverseLink('BackboneCable', 'end_closet')
+    backbones_start = f.ReverseLink('BackboneCable', 'start_closet')
+    horizontalcables = f.ReverseLink('HorizontalCable', 'closet')
 
 
 class BaseContact(n.Netdot):
@@ -658,55 +581,16 @@ class BaseContactList(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def peerings(self):
-        cls = getattr(pynetdot.models, 'BGPPeering')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def contacts(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'DeviceContacts')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def entities(self):
-        cls = getattr(pynetdot.models, 'Entity')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def access_rights(self):
-        cls = getattr(pynetdot.models, 'GroupRight')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def outlets(self):
-        cls = getattr(pynetdot.models, 'HorizontalCable')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def services(self):
-        cls = getattr(pynetdot.models, 'IpService')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def sites(self):
-        cls = getattr(pynetdot.models, 'Site')
-        return cls.search(contactlist=self.id)
-
-    @property
-    def zones(self):
-        cls = getattr(pynetdot.models, 'Zone')
-        return cls.search(contactlist=self.id)
+    peerings = f.ReverseLink('BGPPeering', 'contactlist')
+    contacts = f.ReverseLink('Contact', 'contactlist')
+    devices = f.ReverseLink('DeviceContacts', 'contactlist')
+    entities = f.ReverseLink('Entity', 'contactlist')
+    access_rights = f.ReverseLink('GroupRight', 'contactlist')
+    outlets = f.ReverseLink('HorizontalCable', 'contactlist')
+    interfaces = f.ReverseLink('Interface', 'contactlist')
+    services = f.ReverseLink('IpService', 'contactlist')
+    sites = f.ReverseLink('Site', 'contactlist')
+    zones = f.ReverseLink('Zone', 'contactlist')
 
 
 class BaseContactType(n.Netdot):
@@ -731,10 +615,7 @@ class BaseContactType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def contacts(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(contacttype=self.id)
+    contacts = f.ReverseLink('Contact', 'contacttype')
 
 
 class BaseDevice(n.Netdot):
@@ -890,50 +771,15 @@ class BaseDevice(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def arp_caches(self):
-        cls = getattr(pynetdot.models, 'ArpCache')
-        return cls.search(device=self.id)
-
-    @property
-    def bgppeers(self):
-        cls = getattr(pynetdot.models, 'BGPPeering')
-        return cls.search(device=self.id)
-
-    @property
-    def hosted_devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(host_device=self.id)
-
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'DeviceAttr')
-        return cls.search(device=self.id)
-
-    @property
-    def modules(self):
-        cls = getattr(pynetdot.models, 'DeviceModule')
-        return cls.search(device=self.id)
-
-    @property
-    def contacts(self):
-        cls = getattr(pynetdot.models, 'DeviceContacts')
-        return cls.search(device=self.id)
-
-    @property
-    def forwarding_tables(self):
-        cls = getattr(pynetdot.models, 'FWTable')
-        return cls.search(device=self.id)
-
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(device=self.id)
-
-    @property
-    def stp_instances(self):
-        cls = getattr(pynetdot.models, 'STPInstance')
-        return cls.search(device=self.id)
+    arp_caches = f.ReverseLink('ArpCache', 'device')
+    bgppeers = f.ReverseLink('BGPPeering', 'device')
+    hosted_devices = f.ReverseLink('Device', 'host_device')
+    attributes = f.ReverseLink('DeviceAttr', 'device')
+    modules = f.ReverseLink('DeviceModule', 'device')
+    contacts = f.ReverseLink('DeviceContacts', 'device')
+    forwarding_tables = f.ReverseLink('FWTable', 'device')
+    interfaces = f.ReverseLink('Interface', 'device')
+    stp_instances = f.ReverseLink('STPInstance', 'device')
 
 
 class BaseDeviceAttr(n.Netdot):
@@ -982,10 +828,7 @@ class BaseDeviceAttrName(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'DeviceAttr')
-        return cls.search(name=self.id)
+    attributes = f.ReverseLink('DeviceAttr', 'name')
 
 
 class BaseDeviceContacts(n.Netdot):
@@ -1110,10 +953,7 @@ class BaseDhcpAttrName(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'DhcpAttr')
-        return cls.search(name=self.id)
+    attributes = f.ReverseLink('DhcpAttr', 'name')
 
 
 class BaseDhcpScope(n.Netdot):
@@ -1161,25 +1001,10 @@ class BaseDhcpScope(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['type', 'name']])
         return l.strip()
 
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'DhcpAttr')
-        return cls.search(scope=self.id)
-
-    @property
-    def contained_scopes(self):
-        cls = getattr(pynetdot.models, 'DhcpScope')
-        return cls.search(container=self.id)
-
-    @property
-    def templates(self):
-        cls = getattr(pynetdot.models, 'DhcpScopeUse')
-        return cls.search(scope=self.id)
-
-    @property
-    def derived_scopes(self):
-        cls = getattr(pynetdot.models, 'DhcpScopeUse')
-        return cls.search(template=self.id)
+    attributes = f.ReverseLink('DhcpAttr', 'scope')
+    contained_scopes = f.ReverseLink('DhcpScope', 'container')
+    templates = f.ReverseLink('DhcpScopeUse', 'scope')
+    derived_scopes = f.ReverseLink('DhcpScopeUse', 'template')
 
 
 class BaseDhcpScopeType(n.Netdot):
@@ -1204,10 +1029,7 @@ class BaseDhcpScopeType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def scopes(self):
-        cls = getattr(pynetdot.models, 'DhcpScope')
-        return cls.search(type=self.id)
+    scopes = f.ReverseLink('DhcpScope', 'type')
 
 
 class BaseDhcpScopeUse(n.Netdot):
@@ -1286,70 +1108,19 @@ class BaseEntity(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def bgppeers(self):
-        cls = getattr(pynetdot.models, 'BGPPeering')
-        return cls.search(entity=self.id)
-
-    @property
-    def cables(self):
-        cls = getattr(pynetdot.models, 'BackboneCable')
-        return cls.search(owner=self.id)
-
-    @property
-    def circuits(self):
-        cls = getattr(pynetdot.models, 'Circuit')
-        return cls.search(vendor=self.id)
-
-    @property
-    def links(self):
-        cls = getattr(pynetdot.models, 'SiteLink')
-        return cls.search(entity=self.id)
-
-    @property
-    def owned_devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(owner=self.id)
-
-    @property
-    def used_devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(used_by=self.id)
-
-    @property
-    def roles(self):
-        cls = getattr(pynetdot.models, 'EntityRole')
-        return cls.search(entity=self.id)
-
-    @property
-    def sites(self):
-        cls = getattr(pynetdot.models, 'EntitySite')
-        return cls.search(entity=self.id)
-
-    @property
-    def owned_blocks(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(owner=self.id)
-
-    @property
-    def used_blocks(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(used_by=self.id)
-
-    @property
-    def maintenance_contracts(self):
-        cls = getattr(pynetdot.models, 'MaintContract')
-        return cls.search(provider=self.id)
-
-    @property
-    def employees(self):
-        cls = getattr(pynetdot.models, 'Person')
-        return cls.search(entity=self.id)
-
-    @property
-    def products(self):
-        cls = getattr(pynetdot.models, 'Product')
-        return cls.search(manufacturer=self.id)
+    bgppeers = f.ReverseLink('BGPPeering', 'entity')
+    cables = f.ReverseLink('BackboneCable', 'owner')
+    circuits = f.ReverseLink('Circuit', 'vendor')
+    links = f.ReverseLink('SiteLink', 'entity')
+    owned_devices = f.ReverseLink('Device', 'owner')
+    used_devices = f.ReverseLink('Device', 'used_by')
+    roles = f.ReverseLink('EntityRole', 'entity')
+    sites = f.ReverseLink('EntitySite', 'entity')
+    owned_blocks = f.ReverseLink('Ipblock', 'owner')
+    used_blocks = f.ReverseLink('Ipblock', 'used_by')
+    maintenance_contracts = f.ReverseLink('MaintContract', 'provider')
+    employees = f.ReverseLink('Person', 'entity')
+    products = f.ReverseLink('Product', 'manufacturer')
 
 
 class BaseEntityRole(n.Netdot):
@@ -1419,10 +1190,7 @@ class BaseEntityType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def roles(self):
-        cls = getattr(pynetdot.models, 'EntityRole')
-        return cls.search(type=self.id)
+    roles = f.ReverseLink('EntityRole', 'type')
 
 
 class BaseFiberType(n.Netdot):
@@ -1447,10 +1215,7 @@ class BaseFiberType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def strands(self):
-        cls = getattr(pynetdot.models, 'CableStrand')
-        return cls.search(fiber_type=self.id)
+    strands = f.ReverseLink('CableStrand', 'fiber_type')
 
 
 class BaseFloor(n.Netdot):
@@ -1477,10 +1242,7 @@ class BaseFloor(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['level', 'site']])
         return l.strip()
 
-    @property
-    def rooms(self):
-        cls = getattr(pynetdot.models, 'Room')
-        return cls.search(floor=self.id)
+    rooms = f.ReverseLink('Room', 'floor')
 
 
 class BaseFWTable(n.Netdot):
@@ -1507,10 +1269,7 @@ class BaseFWTable(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['tstamp', 'device']])
         return l.strip()
 
-    @property
-    def entries(self):
-        cls = getattr(pynetdot.models, 'FWTableEntry')
-        return cls.search(fwtable=self.id)
+    entries = f.ReverseLink('FWTableEntry', 'fwtable')
 
 
 class BaseFWTableEntry(n.Netdot):
@@ -1601,10 +1360,7 @@ class BaseHorizontalCable(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['jackid']])
         return l.strip()
 
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(jack=self.id)
+    interfaces = f.ReverseLink('Interface', 'jack')
 
 
 class BaseHostAudit(n.Netdot):
@@ -1733,30 +1489,11 @@ class BaseInterface(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name', 'device']])
         return l.strip()
 
-    @property
-    def arp_entries(self):
-        cls = getattr(pynetdot.models, 'ArpCacheEntry')
-        return cls.search(interface=self.id)
-
-    @property
-    def fwt_entries(self):
-        cls = getattr(pynetdot.models, 'FWTableEntry')
-        return cls.search(interface=self.id)
-
-    @property
-    def neighbors(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(neighbor=self.id)
-
-    @property
-    def vlans(self):
-        cls = getattr(pynetdot.models, 'InterfaceVlan')
-        return cls.search(interface=self.id)
-
-    @property
-    def ips(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(interface=self.id)
+    arp_entries = f.ReverseLink('ArpCacheEntry', 'interface')
+    fwt_entries = f.ReverseLink('FWTableEntry', 'interface')
+    neighbors = f.ReverseLink('Interface', 'neighbor')
+    vlans = f.ReverseLink('InterfaceVlan', 'interface')
+    ips = f.ReverseLink('Ipblock', 'interface')
 
 
 class BaseInterfaceVlan(n.Netdot):
@@ -1851,55 +1588,16 @@ class BaseIpblock(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['address', 'prefix']])
         return l.strip()
 
-    @property
-    def arp_entries(self):
-        cls = getattr(pynetdot.models, 'ArpCacheEntry')
-        return cls.search(ipaddr=self.id)
-
-    @property
-    def snmp_devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(snmp_target=self.id)
-
-    @property
-    def dhcp_scopes(self):
-        cls = getattr(pynetdot.models, 'DhcpScope')
-        return cls.search(ipblock=self.id)
-
-    @property
-    def services(self):
-        cls = getattr(pynetdot.models, 'IpService')
-        return cls.search(ip=self.id)
-
-    @property
-    def children(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(parent=self.id)
-
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'IpblockAttr')
-        return cls.search(ipblock=self.id)
-
-    @property
-    def a_records(self):
-        cls = getattr(pynetdot.models, 'RRADDR')
-        return cls.search(ipblock=self.id)
-
-    @property
-    def ptr_records(self):
-        cls = getattr(pynetdot.models, 'RRPTR')
-        return cls.search(ipblock=self.id)
-
-    @property
-    def sites(self):
-        cls = getattr(pynetdot.models, 'SiteSubnet')
-        return cls.search(subnet=self.id)
-
-    @property
-    def zones(self):
-        cls = getattr(pynetdot.models, 'SubnetZone')
-        return cls.search(subnet=self.id)
+    arp_entries = f.ReverseLink('ArpCacheEntry', 'ipaddr')
+    snmp_devices = f.ReverseLink('Device', 'snmp_target')
+    dhcp_scopes = f.ReverseLink('DhcpScope', 'ipblock')
+    services = f.ReverseLink('IpService', 'ip')
+    children = f.ReverseLink('Ipblock', 'parent')
+    attributes = f.ReverseLink('IpblockAttr', 'ipblock')
+    a_records = f.ReverseLink('RRADDR', 'ipblock')
+    ptr_records = f.ReverseLink('RRPTR', 'ipblock')
+    sites = f.ReverseLink('SiteSubnet', 'subnet')
+    zones = f.ReverseLink('SubnetZone', 'subnet')
 
 
 class BaseIpblockAttr(n.Netdot):
@@ -1948,10 +1646,7 @@ class BaseIpblockAttrName(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'IpblockAttr')
-        return cls.search(name=self.id)
+    attributes = f.ReverseLink('IpblockAttr', 'name')
 
 
 class BaseIpblockStatus(n.Netdot):
@@ -1974,10 +1669,7 @@ class BaseIpblockStatus(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def ipblocks(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(status=self.id)
+    ipblocks = f.ReverseLink('Ipblock', 'status')
 
 
 class BaseIpService(n.Netdot):
@@ -2032,10 +1724,7 @@ class BaseMaintContract(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['provider', 'number']])
         return l.strip()
 
-    @property
-    def assets(self):
-        cls = getattr(pynetdot.models, 'Asset')
-        return cls.search(maint_contract=self.id)
+    assets = f.ReverseLink('Asset', 'maint_contract')
 
 
 class BaseMonitorStatus(n.Netdot):
@@ -2062,20 +1751,9 @@ class BaseMonitorStatus(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(monitorstatus=self.id)
-
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(monitorstatus=self.id)
-
-    @property
-    def ipservices(self):
-        cls = getattr(pynetdot.models, 'IpService')
-        return cls.search(monitorstatus=self.id)
+    devices = f.ReverseLink('Device', 'monitorstatus')
+    interfaces = f.ReverseLink('Interface', 'monitorstatus')
+    ipservices = f.ReverseLink('IpService', 'monitorstatus')
 
 
 class BaseOUI(n.Netdot):
@@ -2156,10 +1834,7 @@ class BasePerson(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['lastname', 'firstname']])
         return l.strip()
 
-    @property
-    def roles(self):
-        cls = getattr(pynetdot.models, 'Contact')
-        return cls.search(person=self.id)
+    roles = f.ReverseLink('Contact', 'person')
 
 
 class BasePhysAddr(n.Netdot):
@@ -2193,35 +1868,12 @@ class BasePhysAddr(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['address']])
         return l.strip()
 
-    @property
-    def arp_entries(self):
-        cls = getattr(pynetdot.models, 'ArpCacheEntry')
-        return cls.search(physaddr=self.id)
-
-    @property
-    def assets(self):
-        cls = getattr(pynetdot.models, 'Asset')
-        return cls.search(physaddr=self.id)
-
-    @property
-    def dhcp_hosts(self):
-        cls = getattr(pynetdot.models, 'DhcpScope')
-        return cls.search(physaddr=self.id)
-
-    @property
-    def fwt_entries(self):
-        cls = getattr(pynetdot.models, 'FWTableEntry')
-        return cls.search(physaddr=self.id)
-
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'Interface')
-        return cls.search(physaddr=self.id)
-
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'PhysAddrAttr')
-        return cls.search(physaddr=self.id)
+    arp_entries = f.ReverseLink('ArpCacheEntry', 'physaddr')
+    assets = f.ReverseLink('Asset', 'physaddr')
+    dhcp_hosts = f.ReverseLink('DhcpScope', 'physaddr')
+    fwt_entries = f.ReverseLink('FWTableEntry', 'physaddr')
+    interfaces = f.ReverseLink('Interface', 'physaddr')
+    attributes = f.ReverseLink('PhysAddrAttr', 'physaddr')
 
 
 class BasePhysAddrAttr(n.Netdot):
@@ -2270,10 +1922,7 @@ class BasePhysAddrAttrName(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def attributes(self):
-        cls = getattr(pynetdot.models, 'PhysAddrAttr')
-        return cls.search(name=self.id)
+    attributes = f.ReverseLink('PhysAddrAttr', 'name')
 
 
 class BaseProduct(n.Netdot):
@@ -2312,10 +1961,7 @@ class BaseProduct(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['manufacturer', 'name']])
         return l.strip()
 
-    @property
-    def assets(self):
-        cls = getattr(pynetdot.models, 'Asset')
-        return cls.search(product_id=self.id)
+    assets = f.ReverseLink('Asset', 'product_id')
 
 
 class BaseProductType(n.Netdot):
@@ -2340,10 +1986,7 @@ class BaseProductType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def products(self):
-        cls = getattr(pynetdot.models, 'Product')
-        return cls.search(type=self.id)
+    products = f.ReverseLink('Product', 'type')
 
 
 class BaseRoom(n.Netdot):
@@ -2371,25 +2014,10 @@ class BaseRoom(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['floor', 'name']])
         return l.strip()
 
-    @property
-    def closets(self):
-        cls = getattr(pynetdot.models, 'Closet')
-        return cls.search(room=self.id)
-
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(room=self.id)
-
-    @property
-    def jacks(self):
-        cls = getattr(pynetdot.models, 'HorizontalCable')
-        return cls.search(room=self.id)
-
-    @property
-    def people(self):
-        cls = getattr(pynetdot.models, 'Person')
-        return cls.search(room=self.id)
+    closets = f.ReverseLink('Closet', 'room')
+    devices = f.ReverseLink('Device', 'room')
+    jacks = f.ReverseLink('HorizontalCable', 'room')
+    people = f.ReverseLink('Person', 'room')
 
 
 class BaseRR(n.Netdot):
@@ -2438,65 +2066,18 @@ class BaseRR(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name', 'zone']])
         return l.strip()
 
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(name=self.id)
-
-    @property
-    def a_records(self):
-        cls = getattr(pynetdot.models, 'RRADDR')
-        return cls.search(rr=self.id)
-
-    @property
-    def cnames(self):
-        cls = getattr(pynetdot.models, 'RRCNAME')
-        return cls.search(rr=self.id)
-
-    @property
-    def ds_records(self):
-        cls = getattr(pynetdot.models, 'RRDS')
-        return cls.search(rr=self.id)
-
-    @property
-    def hinfo_records(self):
-        cls = getattr(pynetdot.models, 'RRHINFO')
-        return cls.search(rr=self.id)
-
-    @property
-    def loc_records(self):
-        cls = getattr(pynetdot.models, 'RRLOC')
-        return cls.search(rr=self.id)
-
-    @property
-    def mx_records(self):
-        cls = getattr(pynetdot.models, 'RRMX')
-        return cls.search(rr=self.id)
-
-    @property
-    def naptr_records(self):
-        cls = getattr(pynetdot.models, 'RRNAPTR')
-        return cls.search(rr=self.id)
-
-    @property
-    def ns_records(self):
-        cls = getattr(pynetdot.models, 'RRNS')
-        return cls.search(rr=self.id)
-
-    @property
-    def ptr_records(self):
-        cls = getattr(pynetdot.models, 'RRPTR')
-        return cls.search(rr=self.id)
-
-    @property
-    def srv_records(self):
-        cls = getattr(pynetdot.models, 'RRSRV')
-        return cls.search(rr=self.id)
-
-    @property
-    def txt_records(self):
-        cls = getattr(pynetdot.models, 'RRTXT')
-        return cls.search(rr=self.id)
+    devices = f.ReverseLink('Device', 'name')
+    a_records = f.ReverseLink('RRADDR', 'rr')
+    cnames = f.ReverseLink('RRCNAME', 'rr')
+    ds_records = f.ReverseLink('RRDS', 'rr')
+    hinfo_records = f.ReverseLink('RRHINFO', 'rr')
+    loc_records = f.ReverseLink('RRLOC', 'rr')
+    mx_records = f.ReverseLink('RRMX', 'rr')
+    naptr_records = f.ReverseLink('RRNAPTR', 'rr')
+    ns_records = f.ReverseLink('RRNS', 'rr')
+    ptr_records = f.ReverseLink('RRPTR', 'rr')
+    srv_records = f.ReverseLink('RRSRV', 'rr')
+    txt_records = f.ReverseLink('RRTXT', 'rr')
 
 
 class BaseRRADDR(n.Netdot):
@@ -2842,10 +2423,7 @@ class BaseService(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def Ips(self):
-        cls = getattr(pynetdot.models, 'IpService')
-        return cls.search(service=self.id)
+    Ips = f.ReverseLink('IpService', 'service')
 
 
 class BaseSite(n.Netdot):
@@ -2900,40 +2478,13 @@ class BaseSite(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name', 'aliases']])
         return l.strip()
 
-    @property
-    def farlinks(self):
-        cls = getattr(pynetdot.models, 'SiteLink')
-        return cls.search(farend=self.id)
-
-    @property
-    def nearlinks(self):
-        cls = getattr(pynetdot.models, 'SiteLink')
-        return cls.search(nearend=self.id)
-
-    @property
-    def devices(self):
-        cls = getattr(pynetdot.models, 'Device')
-        return cls.search(site=self.id)
-
-    @property
-    def entities(self):
-        cls = getattr(pynetdot.models, 'EntitySite')
-        return cls.search(site=self.id)
-
-    @property
-    def floors(self):
-        cls = getattr(pynetdot.models, 'Floor')
-        return cls.search(site=self.id)
-
-    @property
-    def people(self):
-        cls = getattr(pynetdot.models, 'Person')
-        return cls.search(location=self.id)
-
-    @property
-    def subnets(self):
-        cls = getattr(pynetdot.models, 'SiteSubnet')
-        return cls.search(site=self.id)
+    farlinks = f.ReverseLink('SiteLink', 'farend')
+    nearlinks = f.ReverseLink('SiteLink', 'nearend')
+    devices = f.ReverseLink('Device', 'site')
+    entities = f.ReverseLink('EntitySite', 'site')
+    floors = f.ReverseLink('Floor', 'site')
+    people = f.ReverseLink('Person', 'location')
+    subnets = f.ReverseLink('SiteSubnet', 'site')
 
 
 class BaseSiteLink(n.Netdot):
@@ -2964,10 +2515,7 @@ class BaseSiteLink(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def circuits(self):
-        cls = getattr(pynetdot.models, 'Circuit')
-        return cls.search(linkid=self.id)
+    circuits = f.ReverseLink('Circuit', 'linkid')
 
 
 class BaseSiteSubnet(n.Netdot):
@@ -3044,10 +2592,7 @@ class BaseSTPInstance(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['number', 'device']])
         return l.strip()
 
-    @property
-    def stp_ports(self):
-        cls = getattr(pynetdot.models, 'InterfaceVlan')
-        return cls.search(stp_instance=self.id)
+    stp_ports = f.ReverseLink('InterfaceVlan', 'stp_instance')
 
 
 class BaseStrandStatus(n.Netdot):
@@ -3072,10 +2617,7 @@ class BaseStrandStatus(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def strands(self):
-        cls = getattr(pynetdot.models, 'CableStrand')
-        return cls.search(status=self.id)
+    strands = f.ReverseLink('CableStrand', 'status')
 
 
 class BaseSubnetZone(n.Netdot):
@@ -3122,10 +2664,7 @@ class BaseUserType(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def people(self):
-        cls = getattr(pynetdot.models, 'Person')
-        return cls.search(user_type=self.id)
+    people = f.ReverseLink('Person', 'user_type')
 
 
 class BaseVlan(n.Netdot):
@@ -3157,15 +2696,8 @@ class BaseVlan(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['vid']])
         return l.strip()
 
-    @property
-    def interfaces(self):
-        cls = getattr(pynetdot.models, 'InterfaceVlan')
-        return cls.search(vlan=self.id)
-
-    @property
-    def subnets(self):
-        cls = getattr(pynetdot.models, 'Ipblock')
-        return cls.search(vlan=self.id)
+    interfaces = f.ReverseLink('InterfaceVlan', 'vlan')
+    subnets = f.ReverseLink('Ipblock', 'vlan')
 
 
 class BaseVlanGroup(n.Netdot):
@@ -3196,10 +2728,7 @@ class BaseVlanGroup(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def vlans(self):
-        cls = getattr(pynetdot.models, 'Vlan')
-        return cls.search(vlangroup=self.id)
+    vlans = f.ReverseLink('Vlan', 'vlangroup')
 
 
 class BaseZone(n.Netdot):
@@ -3250,20 +2779,9 @@ class BaseZone(n.Netdot):
         l = ' '.join([str(getattr(self, l)) for l in ['name']])
         return l.strip()
 
-    @property
-    def records(self):
-        cls = getattr(pynetdot.models, 'RR')
-        return cls.search(zone=self.id)
-
-    @property
-    def subnets(self):
-        cls = getattr(pynetdot.models, 'SubnetZone')
-        return cls.search(zone=self.id)
-
-    @property
-    def aliases(self):
-        cls = getattr(pynetdot.models, 'ZoneAlias')
-        return cls.search(zone=self.id)
+    records = f.ReverseLink('RR', 'zone')
+    subnets = f.ReverseLink('SubnetZone', 'zone')
+    aliases = f.ReverseLink('ZoneAlias', 'zone')
 
 
 class BaseZoneAlias(n.Netdot):
@@ -1,17 +1,48 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
-from future.utils import python_2_unicode_compatible
+from future.utils import python_2_unicode_compatible, with_metaclass
 from builtins import str
 import os
+import sys
 import logging
-from .serializer import parse_xml
-from .api import NetdotAPI
+import threading
+from contextlib import contextmanager
+from importlib import import_module
+from .serializer import parse_attrs, parse_rows, iter_rows
+from . import signals
+if sys.version_info >= (3, 5):
+    from .aio import AsyncNetdotMixin
+else:
+    AsyncNetdotMixin = object
 
 logger = logging.getLogger(__name__)
 api = None
+async_api = None
 
-def setup(url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False):
+# size of chunks read from streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+# names of query parameters used for paged searches
+PAGE_LIMIT_PARAM = 'limit'
+PAGE_OFFSET_PARAM = 'offset'
+# most linked objects shared by rows of a streamed response at a time
+STREAM_LINKS_SIZE = 10000
+# value of fields not parsed yet, see Netdot.search(only=...)
+DEFERRED = object()
+
+def setup(url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False, pool_size=10, keep_alive=True, identity_map=False, identity_map_size=100000, cache=None, conditional_requests=1000):
     global api
-    api = NetdotAPI(url=url, username=username, password=password, verify=verify, kerberos=kerberos)
+    from .api import NetdotAPI
+    if api is not None:
+        api.close()
+    api = NetdotAPI(url=url, username=username, password=password, verify=verify, kerberos=kerberos, pool_size=pool_size, keep_alive=keep_alive, identity_map=identity_map, identity_map_size=identity_map_size, cache=cache, conditional_requests=conditional_requests)
+
+def setup_async(url='http://localhost/netdot/', username='admin', password='password', verify=True, kerberos=False, pool_size=10, keep_alive=True):
+    """
+    Set up the API used by awaitable model methods (asearch, aget, asave, ...).
+    Requires the httpx module.
+    """
+    global async_api
+    from .aio import AsyncNetdotAPI
+    async_api = AsyncNetdotAPI(url=url, username=username, password=password, verify=verify, kerberos=kerberos, pool_size=pool_size, keep_alive=keep_alive)
 
 def load_settings():
     defaults = {
@@ -19,6 +50,7 @@ def load_settings():
         'password': 'password',
         'url': 'http://localhost/netdot',
         'kerberos': False,
+        'pool_size': 10,
     }
     default_path = os.path.join(os.path.expanduser('~'), '.pynetdot.yaml')
     settings_path = os.environ.get('PYNETDOT_SETTINGS', default_path)
@@ -38,23 +70,219 @@ def load_settings():
             settings[key] = settings_load.get(key, default)
     return settings
 
+def get_api():
+    """
+    Returns the API used by models. If setup was not called yet, it is set up
+    from the configuration file (see load_settings) on first use.
+    """
+    if api is None:
+        setup(**load_settings())
+    return api
+
+def _fan_out(func, items, max_workers=None):
+    """
+    Call func for every item in items using a pool of threads and return the
+    results in the same order as items. Threads share the API session, so by
+    default there are as many of them as there are pooled connections.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers is None:
+        max_workers = get_api().pool_size
+    max_workers = max(1, min(max_workers, len(items)))
+    if max_workers == 1:
+        return [func(item) for item in items]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _response_validator(response):
+    """ETag and Last-Modified of response, None if it has neither."""
+    headers = getattr(response, 'headers', None) or {}
+    validator = (headers.get('ETag'), headers.get('Last-Modified'))
+    if validator == (None, None):
+        return None
+    return validator
+
+
+# batch of the current thread, see batch
+_local = threading.local()
+
+@contextmanager
+def batch(max_workers=None, reload=True):
+    """
+    Unit of work: objects saved within the with block are collected and
+    saved when it ends. Objects are saved concurrently with up to max_workers
+    requests at a time, after the new objects they link to. New objects that
+    saved objects link to are saved too. Inside the block save returns None.
+    reload is passed to save of each object.
+
+    If some objects can not be saved, BulkError is raised. The Batch object
+    has results of all saves and errors of failed ones. Nested batches are
+    saved with the outermost one. Nothing is saved if the block raises.
+    """
+    current = getattr(_local, 'batch', None)
+    if current is not None:
+        yield current
+        return
+    unit = Batch(max_workers, reload)
+    _local.batch = unit
+    try:
+        yield unit
+    finally:
+        _local.batch = None
+    unit.flush()
+
+
+class Batch(object):
+    """
+    Objects to be saved together, see batch.
+
+    objects: objects in the order they were saved
+    results: after flush, save results in the same order, None for failed
+    errors: after flush, dict mapping objects that failed to the exception
+    """
+    def __init__(self, max_workers=None, reload=True):
+        self.max_workers = max_workers
+        self.reload = reload
+        self.objects = []
+        self.results = []
+        self.errors = {}
+        self._added = set()
+
+    def add(self, obj):
+        if id(obj) not in self._added:
+            self._added.add(id(obj))
+            self.objects.append(obj)
+
+    def _dependencies(self, obj):
+        """New objects obj links to."""
+        if obj._values is None:
+            return []
+        return [
+            value for value in obj._values
+            if isinstance(value, Netdot) and not value.id and value is not obj
+        ]
+
+    def _levels(self):
+        """
+        Split objects into lists of objects that can be saved concurrently,
+        with objects linked to by others in earlier lists.
+        """
+        depends = {}
+        queue = list(self.objects)
+        while queue:
+            obj = queue.pop()
+            dependencies = self._dependencies(obj)
+            depends[id(obj)] = set(id(d) for d in dependencies)
+            for dependency in dependencies:
+                if id(dependency) not in self._added:
+                    self.add(dependency)
+                    queue.append(dependency)
+        levels = []
+        done = set()
+        remaining = list(self.objects)
+        while remaining:
+            level = [obj for obj in remaining if depends[id(obj)] <= done]
+            if not level:
+                raise Exception('Objects in batch link to each other in a cycle, can not save them')
+            levels.append(level)
+            done.update(id(obj) for obj in level)
+            remaining = [obj for obj in remaining if id(obj) not in done]
+        return levels, depends
+
+    def flush(self):
+        levels, depends = self._levels()
+        results = {}
+        failed = set()
+
+        def save(obj):
+            try:
+                if depends[id(obj)] & failed:
+                    raise Exception('%s not saved, an object it links to failed' % obj.__class__.__name__)
+                results[id(obj)] = obj.save(reload=self.reload)
+            except Exception as e:
+                self.errors[obj] = e
+
+        for level in levels:
+            _fan_out(save, level, self.max_workers)
+            failed.update(id(obj) for obj in self.errors)
+        self.results = [results.get(id(obj)) for obj in self.objects]
+        if self.errors:
+            raise BulkError('Failed to save %d of %d objects' % (len(self.errors), len(self.objects)), self.results, self.errors)
+
+
+class BulkError(Exception):
+    """
+    Raised when some operations of a bulk call failed.
+
+    results: list of results in input order, None where the operation failed
+    errors: dict mapping failed input items to the exception they raised
+    """
+    def __init__(self, message, results, errors):
+        super(BulkError, self).__init__(message)
+        self.results = results
+        self.errors = errors
+
+
+class DoesNotExist(Exception):
+    """Raised when an object with the requested id does not exist in netdot."""
+
+
+class NetdotMeta(type):
+    """
+    Installs fields listed in _fields of model classes as descriptors named
+    after the field. Attributes defined by the class itself are left alone.
+    Fields may not be named like attributes of Netdot, as they would hide them.
+
+    Instance state lives in slots declared by Netdot. Subclasses get empty
+    __slots__ unless they define their own, so they do not add a __dict__ to
+    each instance. One is still created if some code sets other attributes.
+    """
+    def __new__(mcs, name, bases, attrs):
+        attrs.setdefault('__slots__', ())
+        return super(NetdotMeta, mcs).__new__(mcs, name, bases, attrs)
+
+    def __init__(cls, name, bases, attrs):
+        super(NetdotMeta, cls).__init__(name, bases, attrs)
+        fields = attrs.get('_fields')
+        if fields is None:
+            return
+        cls._fields_by_name = dict((field.name, field) for field in fields)
+        for index, field in enumerate(fields):
+            field.index = index
+            if hasattr(Netdot, field.name):
+                raise Exception('Field %s of %s hides Netdot.%s' % (field.name, name, field.name))
+            if field.name not in attrs:
+                setattr(cls, field.name, field)
+
 
 @python_2_unicode_compatible
-class Netdot(object):
+class Netdot(with_metaclass(NetdotMeta, AsyncNetdotMixin)):
 
     resource = None
 
+    # _values: list of field values, in the same order as _fields
+    # _attrs: raw attributes from netdot, only kept while they are parsed
+    # _original_state: original values of modified fields, None if unmodified
+    # _validator: ETag and Last-Modified of the response the object was
+    #   parsed from, None if unknown
+    __slots__ = ('id', '_resolved', '_values', '_attrs', '_original_state', '_validator', '__dict__', '__weakref__')
+
     def __init__(self, **kwargs):
         self._resolved = False
         self.id = kwargs.get('id', None)
-        self._attrs = {}
-        self._original_state = {}
+        self._values = None
+        self._attrs = None
+        self._original_state = None
+        self._validator = None
         if not self.id:
             # create a new empty instance with default field values
             # there will be nothing to resolve so no point in trying
             self._resolved = True
-            for field in self._fields:
-                setattr(self, field.name, field.default)
+            self._values = [field.default for field in self._fields]
 
     @classmethod
     def _build_search_params(cls, **kwargs):
@@ -64,30 +292,235 @@ class Netdot(object):
         return kwargs
 
     @classmethod
-    def all(cls):
-        return cls._search()
+    def all(cls, prefetch=(), page_size=None, only=None, prefetch_related=()):
+        return cls._search(prefetch=prefetch, page_size=page_size, only=only, prefetch_related=prefetch_related)
+
+    @classmethod
+    def search(cls, prefetch=(), page_size=None, only=None, prefetch_related=(), **kwargs):
+        """
+        Returns objects matching all given field values.
+
+        only: list of names of fields to parse, other fields are parsed when
+            they are first read. Saves time when only a few fields are used.
+        prefetch_related: list of reverse links to fetch for all results, see
+            prefetch_related method.
+        """
+        if not kwargs:
+            raise Exception('Need to specify search parameters')
+        return cls._search(prefetch=prefetch, page_size=page_size, only=only, prefetch_related=prefetch_related, **kwargs)
+
+    @classmethod
+    def _search(cls, prefetch=(), page_size=None, only=None, prefetch_related=(), **kwargs):
+        if page_size:
+            results = list(cls._iter_search(page_size=page_size, only=only, **kwargs))
+        else:
+            params = cls._build_search_params(**kwargs)
+            response = get_api().get(cls.resource, params=params)
+            results = cls._from_search_response(response, only)
+        if prefetch:
+            cls._prefetch(results, prefetch)
+        if prefetch_related:
+            cls.prefetch_related(results, prefetch_related)
+        return results
+
+    @classmethod
+    def iter_all(cls, page_size=None, prefetch_pages=False, only=None):
+        return cls._iter_search(page_size=page_size, prefetch_pages=prefetch_pages, only=only)
 
     @classmethod
-    def search(cls, **kwargs):
+    def iter_search(cls, page_size=None, prefetch_pages=False, only=None, **kwargs):
+        """
+        Like search, but returns an iterator. The response is parsed while it
+        is being downloaded and objects are yielded one at a time, without
+        keeping the whole result in memory.
+
+        If page_size is set, results are requested in pages of page_size
+        objects, one request per page. With prefetch_pages the next page is
+        downloaded in the background while the current one is consumed.
+        """
         if not kwargs:
             raise Exception('Need to specify search parameters')
-        return cls._search(**kwargs)
+        return cls._iter_search(page_size=page_size, prefetch_pages=prefetch_pages, only=only, **kwargs)
 
     @classmethod
-    def _search(cls, **kwargs):
+    def _iter_search(cls, page_size=None, prefetch_pages=False, only=None, **kwargs):
         params = cls._build_search_params(**kwargs)
-        response = api.get(cls.resource, params=params)
+        if page_size:
+            return cls._iter_pages(params, page_size, prefetch_pages, only)
+        return cls._iter_response(params, only)
+
+    @classmethod
+    def _iter_response(cls, params, only=None):
+        only = cls._only_fields(only)
+        response = get_api().get(cls.resource, params=params, stream=True)
+        try:
+            if response.status_code == 404:
+                return
+            if not response.ok:
+                response.raise_for_status()
+            links = {}
+            for attrs in iter_rows(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)):
+                if len(links) > STREAM_LINKS_SIZE:
+                    # objects already yielded keep theirs, only sharing stops
+                    links = {}
+                yield cls._from_search_result(attrs, only, links)
+        finally:
+            response.close()
+
+    @classmethod
+    def _iter_pages(cls, params, page_size, prefetch_pages, only=None):
+        only = cls._only_fields(only)
+
+        def fetch(offset):
+            page_params = dict(params)
+            page_params[PAGE_LIMIT_PARAM] = page_size
+            page_params[PAGE_OFFSET_PARAM] = offset
+            response = get_api().get(cls.resource, params=page_params)
+            if response.status_code == 404:
+                return []
+            if not response.ok:
+                response.raise_for_status()
+            return parse_rows(response.content)
+
+        executor = None
+        if prefetch_pages:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            page = fetch(offset)
+            first_id = None
+            while page:
+                if page[0]['id'] == first_id:
+                    # server ignores paging and sent the same objects again
+                    break
+                first_id = page[0]['id']
+                last_page = len(page) != page_size
+                if not last_page and executor:
+                    next_page = executor.submit(fetch, offset + page_size)
+                links = {}
+                for attrs in page:
+                    yield cls._from_search_result(attrs, only, links)
+                if last_page:
+                    # a short page is the last one, a longer one means the
+                    # server ignored paging and sent all objects at once
+                    break
+                offset += page_size
+                page = next_page.result() if executor else fetch(offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    @classmethod
+    def _from_search_response(cls, response, only=None):
         if response.status_code == 404:
             return []
-        if not response.ok:
+        if response.status_code >= 400:
             response.raise_for_status()
-        xml = parse_xml(response.content)
-        results = []
-        for c in xml:
-            obj = cls(id=c.attrib['id'])
-            cls._from_netdot(obj, c.attrib)
-            results.append(obj)
-        return results
+        only = cls._only_fields(only)
+        links = {}
+        return [cls._from_search_result(attrs, only, links) for attrs in parse_rows(response.content)]
+
+    @classmethod
+    def _from_search_result(cls, attrs, only=None, links=None):
+        obj = cls._instance(int(attrs['id']))
+        if not (obj._resolved and obj.is_dirty()):
+            # do not overwrite local changes of a shared instance
+            cls._from_netdot(obj, attrs, only, links)
+        return obj
+
+    @classmethod
+    def _only_fields(cls, names):
+        """Fields named in names, None if names is None."""
+        if names is None:
+            return None
+        if isinstance(names, str):
+            names = [names]
+        return [cls._get_field(name) for name in names]
+
+    @classmethod
+    def _get_field(cls, name):
+        for field in cls._fields:
+            if field.name == name:
+                return field
+        raise Exception('%s has no field %s' % (cls.__name__, name))
+
+    @classmethod
+    def _prefetch(cls, objects, names):
+        """
+        Resolve objects linked from objects by LinkFields listed in names.
+        Each distinct linked object is fetched only once and requests are made
+        concurrently. Every stub referencing it is then filled in.
+        """
+        if isinstance(names, str):
+            names = [names]
+        fields = [cls._get_field(name) for name in names]
+        for field in fields:
+            if not hasattr(field, 'link_to'):
+                raise Exception('Can not prefetch %s, it is not a link' % field.name)
+        stubs = {}
+        for obj in objects:
+            for field in fields:
+                linked = getattr(obj, field.name)
+                if linked is None or linked._resolved:
+                    continue
+                stubs.setdefault((linked.__class__, linked.id), []).append(linked)
+
+        def fetch(key):
+            class_, id = key
+            try:
+                return class_.get(id)
+            except Exception as e:
+                # leave the stubs unresolved, they will raise when accessed
+                logger.debug('Prefetching %s ID:%d failed: %s' % (class_, id, e))
+                return None
+
+        keys = list(stubs.keys())
+        for key, resolved in zip(keys, _fan_out(fetch, keys)):
+            if resolved is None:
+                continue
+            for stub in stubs[key]:
+                stub._assign(resolved)
+
+    @classmethod
+    def prefetch_related(cls, objects, names, max_workers=None):
+        """
+        Fetch objects of reverse links named in names (i.e. 'interfaces') for
+        all objects, concurrently. They are kept on each object, so reading
+        the link later does not make a request.
+
+        Names can be paths through several links separated by dots, i.e.
+        'interfaces.vlans' also fetches vlans of every interface. Links to
+        single objects can be part of a path too ('interfaces.neighbor').
+        Each level is fetched once for all objects in it.
+        """
+        if isinstance(names, str):
+            names = [names]
+        tree = {}
+        for name in names:
+            node = tree
+            for part in name.split('.'):
+                node = node.setdefault(part, {})
+        cls._prefetch_tree(objects, tree, max_workers)
+
+    @classmethod
+    def _prefetch_tree(cls, objects, tree, max_workers):
+        for name, subtree in tree.items():
+            link = getattr(cls, name, None)
+            if hasattr(link, 'prefetch'):
+                link.prefetch(objects, max_workers)
+                next_class = link.link_class
+                next_objects = [related for obj in objects for related in link.related(obj)]
+            elif hasattr(cls._fields_by_name.get(name), 'link_to'):
+                cls._prefetch(objects, [name])
+                next_class = getattr(import_module('.models', __package__), cls._fields_by_name[name].link_to)
+                next_objects = [getattr(obj, name) for obj in objects]
+            else:
+                raise Exception('%s has no link %s' % (cls.__name__, name))
+            if subtree:
+                # the same object may be reached from many objects
+                unique = dict((id(obj), obj) for obj in next_objects if obj is not None)
+                next_class._prefetch_tree(list(unique.values()), subtree, max_workers)
 
     @classmethod
     def get_first(cls, **kwargs):
@@ -98,42 +531,121 @@ class Netdot(object):
 
     @classmethod
     def get(cls, id):
-        obj = cls(id=id)
-        obj._resolve()
+        obj = cls._instance(int(id))
+        if not obj._resolved:
+            obj._resolve()
         return obj
 
+    @classmethod
+    def get_many(cls, ids, max_workers=None):
+        """
+        Get objects for all ids, fetching them concurrently. Objects are
+        returned in the same order as ids. If any of them could not be fetched,
+        BulkError is raised with the errors for each failed id.
+        """
+        ids = [int(id) for id in ids]
+        unique_ids = list(set(ids))
+        errors = {}
+
+        def fetch(id):
+            try:
+                return cls.get(id)
+            except Exception as e:
+                errors[id] = e
+                return None
+
+        fetched = dict(zip(unique_ids, _fan_out(fetch, unique_ids, max_workers)))
+        results = [fetched[id] for id in ids]
+        if errors:
+            raise BulkError('Failed to get %d of %d %s objects' % (len(errors), len(unique_ids), cls.__name__), results, errors)
+        return results
+
+    @classmethod
+    def _instance(cls, id):
+        """
+        Return an unresolved instance for id. When the API keeps an identity
+        map, the instance already known for this id is returned instead.
+        """
+        if api is None or api.identity_map is None:
+            return cls(id=id)
+        return api.identity_map.get_or_create(cls, id)
+
     def _resolve(self):
         """
         GET object attributes for this object (by its id) and set its fields.
         """
         logger.debug('Resolving %s ID:%d' % (self.__class__, self.id))
+        response = get_api().get(self._resolve_resource())
+        self._from_resolve_response(response)
+
+    def reload(self):
+        """
+        Fetch current attributes of this object from netdot, discarding unsaved
+        changes. Returns True if the object changed. If netdot answers that
+        the response this object was parsed from is current (304 Not
+        Modified), the response is not parsed again.
+        """
+        response = get_api().get(self._resolve_resource())
+        if (getattr(response, 'not_modified', False) and self._resolved and not self.get_dirty_fields()
+                and self._validator is not None and self._validator == _response_validator(response)):
+            return False
+        self._from_resolve_response(response)
+        return True
+
+    def _resolve_resource(self):
         if not self.id:
             raise Exception('id not set')
-        resource = '%s%s' % (self.resource, self.id)
-        response = api.get(resource)
+        return '%s%s' % (self.resource, self.id)
+
+    def _from_resolve_response(self, response):
         if response.status_code == 404:
-            raise Exception('%s with id %d does not exist in netdot' % (self.resource, self.id))
-        if not response.ok:
+            raise DoesNotExist('%s with id %d does not exist in netdot' % (self.resource, self.id))
+        if response.status_code >= 400:
             response.raise_for_status()
         self._from_response(response)
+        self._validator = _response_validator(response)
 
     def _from_response(self, response):
-        xml = parse_xml(response.content)
         # returns a single tag: <opt id="...
-        attrs = xml.attrib
+        attrs = parse_attrs(response.content)
         self._from_netdot(self, attrs)
 
     @classmethod
-    def _from_netdot(cls, obj, attrs):
-        """Create instance fields from netdot's XML response."""
+    def _from_netdot(cls, obj, attrs, only=None, links=None):
+        """
+        Create instance fields from netdot's XML response. If only is a list
+        of fields, other fields are parsed from attrs when they are read.
+        links is a dict of linked objects shared with other rows of the same
+        response, see fields.compile_parser.
+        """
         if not isinstance(obj, cls):
             raise Exception('Passed object is not an instance of this class')
         obj._attrs = attrs
-        for field in cls._fields:
-            field.parse(obj)
+        if only is None:
+            # compiled for each class when it parses its first row
+            parse_row = cls.__dict__.get('_parse_row')
+            if parse_row is None:
+                from .fields import compile_parser
+                parse_row = cls._parse_row = compile_parser(cls._fields)
+            parse_row(obj, attrs, {} if links is None else links)
+            obj._attrs = None
+        else:
+            obj._values = [DEFERRED] * len(cls._fields)
+            for field in only:
+                field.parse(obj)
         obj.id = int(attrs['id'])
         obj._resolved = True
-        obj._original_state = obj._as_dict()
+        obj._original_state = None
+        obj._validator = None
+
+    def _assign(self, other):
+        """Copy state of a resolved instance of the same object into this one."""
+        self._values = list(other._values)
+        self._attrs = other._attrs
+        self.id = other.id
+        self._original_state = None
+        self._validator = other._validator
+        self._resolved = True
 
     def _as_dict(self):
         values = dict()
@@ -143,13 +655,15 @@ class Netdot(object):
 
     def get_dirty_fields(self):
         """Return a list of fields that have been modified."""
-        new_state = self._as_dict()
-        changed_fields = dict([
-            (key, value)
-            for key, value in self._original_state.items()
-            if value != new_state[key]
-        ])
-        return changed_fields.keys()
+        # _original_state holds original values of fields that were written to
+        if not self._original_state:
+            return []
+        fields = self._fields_by_name
+        return [
+            name
+            for name, value in self._original_state.items()
+            if value != fields[name].raw(getattr(self, name))
+        ]
 
     def is_dirty(self):
         """Returns True if object was modified."""
@@ -186,40 +700,68 @@ class Netdot(object):
         """
         pass
 
-    def save(self):
+    def save(self, reload=True):
         """
         Save changes to this object back to netdot. Or create a new object if
         id is not set.
+
+        reload: True to set all fields from the object returned by netdot.
+            False to keep local values, which is faster, only the id of a new
+            object is taken from the response. Or a list of names of fields
+            to set from the response.
         """
-        if not self.is_dirty():
+        current = getattr(_local, 'batch', None)
+        if current is not None:
+            current.add(self)
+            return None
+        request = self._save_request()
+        if request is None:
             # There were no changes
             return True
+        resource, params = request
+        response = get_api().post(resource, params)
+        return self._from_save_response(response, reload)
+
+    def _save_request(self):
+        """
+        Returns resource and params to POST to save this object or None if
+        there is nothing to save.
+        """
+        if not self.is_dirty():
+            return None
         if self.id:
-            field_names = self.get_dirty_fields()
-            fields = []
-            for fn in field_names:
-                for f in self._fields:
-                    if f.name == fn:
-                        fields.append(f)
+            fields = [self._fields_by_name[fn] for fn in self.get_dirty_fields()]
             resource = '%s%s' % (self.resource, self.id)
         else:
             fields = self._fields
             resource = self.resource
-        values = self._as_dict()
         params = {}
         for f in fields:
             value_serialized = f.serialize(self)
             params[f.name] = value_serialized
         self.pre_save_params_clean(params)
-        response = api.post(resource, params)
+        return resource, params
+
+    def _from_save_response(self, response, reload=True):
         if response.status_code == 404:
             return False
-        if not response.ok:
+        if response.status_code >= 400:
             response.raise_for_status()
-        # Reset all values from server response
-        self._from_response(response)
+        if reload is True:
+            # Reset all values from server response
+            self._from_response(response)
+        elif reload or not self.id:
+            attrs = parse_attrs(response.content)
+            self.id = int(attrs['id'])
+            self._attrs = attrs
+            for name in reload or ():
+                self._fields_by_name[name].parse(self)
+            self._attrs = None
+        if api is not None and api.identity_map is not None:
+            api.identity_map.add(self)
         # Reset initial field values
-        self._original_state = self._as_dict()
+        self._original_state = None
+        signals.post_save.send(type(self), self)
         return True
 
     def delete(self):
@@ -228,11 +770,17 @@ class Netdot(object):
             # no id means this object was not created in netdot yet
             return True
         resource = '%s%s' % (self.resource, self.id)
-        response = api.delete(resource)
+        response = get_api().delete(resource)
+        return self._from_delete_response(response)
+
+    def _from_delete_response(self, response):
         if response.status_code == 404:
             return False
-        if not response.ok:
+        if response.status_code >= 400:
             response.raise_for_status()
+        if api is not None and api.identity_map is not None:
+            api.identity_map.discard(self)
+        signals.post_delete.send(type(self), self)
         # Unset id so saving this instance again will create a new object in netdot DB
         self.id = None
         return True
@@ -242,14 +790,12 @@ class Netdot(object):
         Unresolved instances do not have their attributes set yet. Resolve the
         object before trying to get its attribute.
         """
-        if not self._resolved:
-            self._resolve()
-        try:
-            return self.__dict__[attr]
-        except KeyError as e:
+        if attr.startswith('_') or self._resolved:
             if default:
                 return default
             raise AttributeError("%r object has no attribute %r" % (self.__class__, attr))
+        self._resolve()
+        return getattr(self, attr)
 
     def __str__(self):
         return self.label
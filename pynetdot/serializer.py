@@ -5,16 +5,158 @@ import xml.etree.ElementTree as ET
 # ''.join([chr(i) for i in range(9)+[11,12]+range(14,32)])
 INVALID_CHARS = '\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'
 INVALID_CHARS_DICT = {ord(c): None for c in INVALID_CHARS}
+# control chars are single bytes in utf-8 and never part of a multibyte
+# sequence, so they can be removed before the data is decoded
+INVALID_BYTES = INVALID_CHARS.encode('ascii')
+INVALID_CHARS_WARNING = 'One or more invalid characters found in XML string received from netdot API. They were removed. Unpredictable side effects possible.'
+
+
+class StdlibBackend(object):
+    """Parse XML with xml.etree.ElementTree from the standard library."""
+    name = 'stdlib'
+
+    def fromstring(self, data):
+        return ET.fromstring(data)
+
+    def iterparse(self, source):
+        return ET.iterparse(source, events=('start', 'end'))
+
+    def rows(self, data):
+        return [c.attrib for c in self.fromstring(data)]
+
+    def attrs(self, element):
+        return element.attrib
+
+
+class LxmlBackend(object):
+    """
+    Parse XML with lxml. Rows are collected straight from parser events into
+    dicts, without building an element tree.
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        from lxml import etree
+        self.etree = etree
+
+    def fromstring(self, data):
+        etree = self.etree
+        return etree.fromstring(data, parser=etree.XMLParser(huge_tree=True, resolve_entities=False))
+
+    def rows(self, data):
+        etree = self.etree
+        # with resolve_entities=False a parser target gets &amp; as &#38;,
+        # external entities are not loaded either way (no DTD is loaded)
+        parser = etree.XMLParser(target=_RowsTarget(), huge_tree=True)
+        return etree.fromstring(data, parser=parser)
+
+    def iterparse(self, source):
+        return self.etree.iterparse(source, events=('start', 'end'), huge_tree=True, resolve_entities=False)
+
+    def attrs(self, element):
+        # copy into a plain dict, so the element can be freed
+        return dict(element.attrib)
+
+
+class _RowsTarget(object):
+    """lxml parser target collecting attributes of children of the root."""
+
+    def __init__(self):
+        self._rows = []
+        self._depth = 0
+
+    def start(self, tag, attrib):
+        self._depth += 1
+        if self._depth == 2:
+            self._rows.append(attrib)
+
+    def end(self, tag):
+        self._depth -= 1
+
+    def close(self):
+        return self._rows
+
+
+# selected when the first response is parsed, see get_backend
+backend = None
+
+# object with escaped characters, parse_rows and parse_attrs must agree on it
+CHECK_XML = b'<opt id="1" a="&amp; &lt;&gt; &quot;&apos; &#233;" />'
+
+
+def _check_backend(backend):
+    """Raises an exception if rows and attrs of backend parse differently."""
+    attrs = dict(backend.attrs(backend.fromstring(CHECK_XML)))
+    rows = backend.rows(b'<opt>%s</opt>' % CHECK_XML)
+    if [attrs] != [dict(row) for row in rows] or attrs['a'] != u'& <> "\' \xe9':
+        raise Exception('XML backend %s parses %r wrongly' % (backend.name, CHECK_XML))
+    return backend
+
+
+def set_backend(name):
+    """
+    Select XML parser used for netdot responses: 'lxml' or 'stdlib'. By
+    default lxml is used when it is installed.
+    """
+    global backend
+    if name == 'lxml':
+        try:
+            backend = _check_backend(LxmlBackend())
+        except ImportError:
+            raise Exception('lxml is not installed')
+    elif name == 'stdlib':
+        backend = _check_backend(StdlibBackend())
+    else:
+        raise Exception('Unknown XML backend %s' % name)
+
+def get_backend():
+    global backend
+    if backend is None:
+        try:
+            backend = _check_backend(LxmlBackend())
+        except ImportError:
+            backend = _check_backend(StdlibBackend())
+    return backend
 
 
 def parse_xml(data):
-    if type(data) is not str:
-        # on python3 response will be bytes() and needs to be decoded as utf-8
-        data = data.decode('utf-8')
     data = _xml_pre_clean(data)
-    root = ET.fromstring(data)
+    root = get_backend().fromstring(data)
     return root
 
+def parse_attrs(data):
+    """Returns attributes of the root element, i.e. a single object."""
+    return get_backend().attrs(parse_xml(data))
+
+def parse_rows(data):
+    """Returns a list of attributes of each child of the root element."""
+    return get_backend().rows(_xml_pre_clean(data))
+
+def iter_rows(chunks):
+    """
+    Incrementally parse XML document given as an iterable of byte chunks.
+    Yields attributes of each child of the root element as soon as it is
+    complete. Elements are removed from the tree once consumed, so memory use
+    does not grow with the size of the document.
+    """
+    stream = _CleanStream(chunks)
+    backend = get_backend()
+    attrs = backend.attrs
+    root = None
+    depth = 0
+    for event, elem in backend.iterparse(stream):
+        if event == 'start':
+            depth += 1
+            if root is None:
+                root = elem
+            continue
+        depth -= 1
+        if depth == 1:
+            yield attrs(elem)
+            root.clear()
+    if stream.cleaned:
+        warnings.warn(INVALID_CHARS_WARNING)
+
 def _xml_pre_clean(data):
     # i've seen cases wher netdot sends invalid chars in xml response
     # these were mostly control chars in dp_remote_port in Interface endpoint
@@ -24,8 +166,39 @@ def _xml_pre_clean(data):
     # but until it is, we still want pynetdot to not crash
     # so, i'll strip out some invalid chars and hope for the best
     # also throw a warning at user
-    if any(c in data for c in INVALID_CHARS):
-        warnings.warn('One or more invalid characters found in XML string received from netdot API. They were removed. Unpredictable side effects possible.')
-        return data.translate(INVALID_CHARS_DICT)
-    else:
+    # The data is cleaned as bytes in a single pass and handed to the parser
+    # without decoding it first.
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    cleaned = data.translate(None, INVALID_BYTES)
+    if len(cleaned) != len(data):
+        warnings.warn(INVALID_CHARS_WARNING)
+    return cleaned
+
+
+class _CleanStream(object):
+    """
+    File-like object reading from an iterable of byte chunks. Invalid chars
+    are stripped from each chunk as it is read (see _xml_pre_clean).
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+        self.cleaned = False
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                break
+            cleaned = chunk.translate(None, INVALID_BYTES)
+            if len(cleaned) != len(chunk):
+                self.cleaned = True
+            self._buffer += cleaned
+        if size < 0:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
         return data
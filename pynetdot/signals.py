@@ -0,0 +1,37 @@
+"""
+Signals sent when objects are saved to or deleted from netdot through
+pynetdot, so other code can keep derived data up to date:
+
+>>> def saved(sender, instance):
+....    print 'saved', instance
+>>> pynetdot.signals.post_save.connect(saved, sender=pynetdot.Ipblock)
+
+Receivers are called with the model class and the object. post_delete is
+sent before the id of the deleted object is unset.
+"""
+import threading
+
+
+class Signal(object):
+    def __init__(self):
+        self._receivers = []
+        self._lock = threading.Lock()
+
+    def connect(self, receiver, sender=None):
+        """Call receiver when the signal is sent for sender (or any model)."""
+        with self._lock:
+            if (receiver, sender) not in self._receivers:
+                self._receivers = self._receivers + [(receiver, sender)]
+
+    def disconnect(self, receiver, sender=None):
+        with self._lock:
+            self._receivers = [r for r in self._receivers if r != (receiver, sender)]
+
+    def send(self, sender, instance):
+        for receiver, receiver_sender in self._receivers:
+            if receiver_sender is None or issubclass(sender, receiver_sender):
+                receiver(sender, instance)
+
+
+post_save = Signal()
+post_delete = Signal()
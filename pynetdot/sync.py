@@ -0,0 +1,238 @@
+"""
+Incremental sync of netdot objects into a local store, driven by netdot's
+Audit table.
+
+Netdot records inserts, updates and deletes made by users in the Audit table.
+Its ids grow with every change, so the id of the last audit record applied is
+the high-water mark of a sync. The REST API can not search for ids above it,
+so new audit records are fetched by id, a window of ids at a time. When a
+whole window does not exist, ids further ahead are tried before taking it as
+the end of the table, so gaps in ids (i.e. a pruned Audit table) are skipped.
+"""
+from __future__ import absolute_import
+from collections import namedtuple
+import logging
+from .netdot import BulkError, DoesNotExist, _fan_out
+
+logger = logging.getLogger(__name__)
+
+# operation is 'insert', 'update' or 'delete', object is None for deletes
+Change = namedtuple('Change', ['operation', 'model', 'id', 'object'])
+
+AUDIT_ID = 'audit_id'
+# highest audit id looked for on the first run
+MAX_AUDIT_ID = 2 ** 31
+
+
+class MemoryStore(object):
+    """
+    Store keeping synced objects in memory. Other stores (i.e. a database
+    table per model) need the same methods.
+
+    objects: dict mapping model names to dicts of {id: attributes}, where
+        attributes are raw field values as returned by Netdot._as_dict
+    state: dict of sync state, i.e. the high-water mark
+    """
+    def __init__(self):
+        self.objects = {}
+        self.state = {}
+
+    def put(self, model, id, attrs):
+        self.objects.setdefault(model, {})[id] = attrs
+
+    def delete(self, model, id):
+        self.objects.get(model, {}).pop(id, None)
+
+    def get_state(self, key):
+        return self.state.get(key)
+
+    def set_state(self, key, value):
+        self.state[key] = value
+
+
+class Sync(object):
+    """
+    Keeps a store in sync with netdot objects of the given models.
+
+    models: list of model classes or their names, i.e. ['Device', 'Interface']
+    store: where objects are kept, MemoryStore by default
+    window: number of audit ids fetched at a time
+    max_workers: number of concurrent requests, see Netdot.get_many
+    max_gap: largest gap of missing audit ids skipped after the first run;
+        a larger one is taken as the end of the audit table
+
+    The first run stores all objects of each model and the current high-water
+    mark. Later runs only fetch objects that audit records show were changed.
+    """
+    def __init__(self, models, store=None, window=100, max_workers=None, max_gap=10000):
+        from . import models as netdot_models
+        self.models = {}
+        for model in models:
+            if not isinstance(model, type):
+                model = getattr(netdot_models, model)
+            self.models[model.__name__] = model
+        self.store = store if store is not None else MemoryStore()
+        self.window = window
+        self.max_gap = max_gap
+        self.max_workers = max_workers
+
+    def run(self):
+        """
+        Bring the store up to date. Returns an iterator of Change tuples, the
+        store is updated as it is consumed.
+        """
+        store = self.store
+        audit_id = store.get_state(AUDIT_ID)
+        new_models = [name for name in sorted(self.models) if not store.get_state('synced.%s' % name)]
+        if new_models:
+            if audit_id is None:
+                # mark taken before the snapshot, changes made during it are applied again next time
+                current = self._current_audit_id()
+            for name in new_models:
+                for change in self._snapshot(name):
+                    yield change
+                store.set_state('synced.%s' % name, True)
+            if audit_id is None:
+                store.set_state(AUDIT_ID, current)
+                return
+        for change in self._apply_audits(audit_id):
+            yield change
+
+    def _current_audit_id(self):
+        first = self._next_audit_id(0, max_gap=MAX_AUDIT_ID)
+        if first is None:
+            logger.warning('Sync: found no Audit records, starting from 0')
+            return 0
+        return self._last_audit_id(first)
+
+    def _snapshot(self, name):
+        logger.info('Sync: storing all %s objects' % name)
+        for obj in self.models[name].iter_all():
+            self.store.put(name, obj.id, obj._as_dict())
+            yield Change('insert', name, obj.id, obj)
+
+    def _apply_audits(self, audit_id):
+        from .models import Audit
+        while True:
+            # a single GET when nothing changed, before a whole window
+            found = self._fetch(Audit, [audit_id + 1])
+            if not found:
+                next_id = self._next_audit_id(audit_id, checked=1)
+                if next_id is None:
+                    return
+                logger.warning('Sync: audit ids %d to %d do not exist, skipping them' % (audit_id + 1, next_id - 1))
+                audit_id = next_id - 1
+                continue
+            found.update(self._fetch(Audit, range(audit_id + 2, audit_id + 1 + self.window)))
+            audits = sorted(found.values(), key=lambda a: a.id)
+            # last operation on each object wins
+            changed = {}
+            for audit in audits:
+                if audit.tablename in self.models and audit.object_id:
+                    changed[(audit.tablename, audit.object_id)] = audit.operation
+            for change in self._apply(changed):
+                yield change
+            audit_id = audits[-1].id
+            self.store.set_state(AUDIT_ID, audit_id)
+
+    def _apply(self, changed):
+        by_model = {}
+        for (name, id), operation in changed.items():
+            by_model.setdefault(name, {})[id] = operation
+        for name in sorted(by_model):
+            operations = by_model[name]
+            fetch_ids = [id for id, operation in operations.items() if operation != 'delete']
+            objects = self._fetch(self.models[name], fetch_ids, reload=True)
+            for id in sorted(operations):
+                obj = objects.get(id)
+                if obj is None:
+                    # deleted, possibly after a later insert or update
+                    self.store.delete(name, id)
+                    yield Change('delete', name, id, None)
+                else:
+                    self.store.put(name, id, obj._as_dict())
+                    yield Change(operations[id], name, id, obj)
+
+    def _fetch(self, cls, ids, reload=False):
+        """Fetch objects concurrently, returns {id: object} of those that exist."""
+        ids = list(ids)
+        errors = {}
+
+        def fetch(id):
+            obj = cls._instance(id)
+            if obj._resolved and obj.is_dirty():
+                # do not overwrite local changes of a shared instance
+                obj = cls(id=id)
+            try:
+                if reload or not obj._resolved:
+                    obj.reload()
+            except DoesNotExist:
+                return None
+            except Exception as e:
+                errors[id] = e
+                return None
+            return obj
+
+        objects = _fan_out(fetch, ids, self.max_workers)
+        if errors:
+            raise BulkError('Failed to get %d of %d %s objects' % (len(errors), len(ids), cls.__name__), objects, errors)
+        return dict((id, obj) for id, obj in zip(ids, objects) if obj is not None)
+
+    def _audit_exists(self, id):
+        from .models import Audit
+        return bool(self._fetch(Audit, [id]))
+
+    def _next_audit_id(self, start, checked=0, max_gap=None):
+        """
+        Find the lowest id of an audit record above start, None if there is
+        none within max_gap ids (self.max_gap by default). Ids up to
+        start + checked are known not to exist. Ids at doubling distances
+        from start are tried at once, then the first existing id before the
+        nearest one that exists is found by bisecting.
+        This assumes ids after a gap exist up to the newest one, as in a
+        pruned Audit table. Other gaps can make the result too high, skipping
+        some changes, or hide audit records until newer ones are added.
+        """
+        from .models import Audit
+        if max_gap is None:
+            max_gap = self.max_gap
+        probes = []
+        offset = max(checked * 2, 1)
+        while offset <= max_gap:
+            probes.append(start + offset)
+            offset *= 2
+        found = self._fetch(Audit, probes)
+        if not found:
+            return None
+        high = min(found)
+        low = max([start + checked] + [id for id in probes if id < high])
+        exists = self._audit_exists
+        while high - low > 1:
+            middle = (low + high) // 2
+            if exists(middle):
+                high = middle
+            else:
+                low = middle
+        return high
+
+    def _last_audit_id(self, start):
+        """
+        Find the id of the newest audit record from the existing id start by
+        doubling a step until an id does not exist, then bisecting. Gaps in
+        ids can make the result too low, which only means some changes are
+        applied twice.
+        """
+        exists = self._audit_exists
+        low = start
+        step = 1
+        while exists(low + step):
+            low += step
+            step *= 2
+        high = low + step
+        while high - low > 1:
+            middle = (low + high) // 2
+            if exists(middle):
+                low = middle
+            else:
+                high = middle
+        return low
@@ -25,8 +25,12 @@ setup(
 
     packages=['pynetdot', 'pynetdot/models'],
 
-    install_requires=['python-dateutil', 'requests', 'PyYAML', 'future'],
+    install_requires=['python-dateutil', 'requests', 'PyYAML', 'future', 'futures; python_version < "3"', 'ipaddress; python_version < "3"'],
     requires=['dateutil', 'requests', 'yaml', 'future'],
+    extras_require={
+        'async': ['httpx'],
+        'lxml': ['lxml'],
+    },
 
     classifiers=[
         'Development Status :: 4 - Beta',